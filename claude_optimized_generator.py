@@ -207,12 +207,7 @@ class ClaudeOptimizedFilter:
         semantic_clarity = self.analyze_semantic_clarity(word)
         
         # Calculate overall score
-        base_score = self.base_filter.scorer.score_word(word).total_score
-        overall_score = (
-            base_score * 0.3 +
-            phonetic_clarity * 0.4 +
-            semantic_clarity * 0.3
-        )
+        overall_score = self._overall_score(word, phonetic_clarity, semantic_clarity)
         
         return WordFeatures(
             word=word,
@@ -225,6 +220,31 @@ class ClaudeOptimizedFilter:
             overall_score=overall_score
         )
     
+    def is_premium(self, word: str, threshold: float = 1.5) -> bool:
+        """Check if a word reaches the premium tier.
+        
+        Computes only the overall score, skipping the syllable and pattern
+        features and the WordFeatures object that analyze_word builds.
+        """
+        word = word.lower().strip()
+        
+        overall_score = self._overall_score(
+            word,
+            self.analyze_phonetic_clarity(word),
+            self.analyze_semantic_clarity(word)
+        )
+        return overall_score >= threshold
+    
+    def _overall_score(self, word: str, phonetic_clarity: float,
+                       semantic_clarity: float) -> float:
+        """Weight the base score and the clarity scores into one overall score."""
+        base_score = self.base_filter.scorer.score_word(word).total_score
+        return (
+            base_score * 0.3 +
+            phonetic_clarity * 0.4 +
+            semantic_clarity * 0.3
+        )
+    
     def get_word_tier(self, features: WordFeatures) -> str:
         """Categorize word into quality tier."""
         if features.overall_score >= 1.5:
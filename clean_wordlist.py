@@ -146,15 +146,18 @@ def clean_wordlist():
     print(f"\nFinal wordlist: {len(final_words)} words")
     print(f"All words are English: {all(is_english_word(word) for word in final_words)}")
     
+    # Sort once and reuse for both files and the sample output
+    sorted_words = sorted(final_words)
+    
     # Save cleaned wordlist
     cleaned_file = Path("wordlists/gold_wordlist_65536_cleaned.txt")
     with open(cleaned_file, 'w') as f:
-        for word in sorted(final_words):
+        for word in sorted_words:
             f.write(f"{word}\n")
     
     # Update the original file
     with open(gold_file, 'w') as f:
-        for word in sorted(final_words):
+        for word in sorted_words:
             f.write(f"{word}\n")
     
     # Create replacement log
@@ -184,8 +187,8 @@ def clean_wordlist():
     
     # Show sample of final words
     print(f"\nSample of cleaned wordlist:")
-    print(f"  First 10: {sorted(final_words)[:10]}")
-    print(f"  Last 10: {sorted(final_words)[-10:]}")
+    print(f"  First 10: {sorted_words[:10]}")
+    print(f"  Last 10: {sorted_words[-10:]}")
     
     print(f"\n✓ Wordlist cleaned successfully!")
 
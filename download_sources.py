@@ -14,37 +14,91 @@ UV Dependencies:
 # ]
 # ///
 
+import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
 
-def download_bip39() -> List[str]:
+
+BIP39_URL = "https://raw.githubusercontent.com/bitcoin/bips/master/bip-0039/english.txt"
+TOP_ENGLISH_URL = "https://raw.githubusercontent.com/david47k/top-english-wordlists/master/top_english_words_lower_100000.txt"
+
+
+def fetch_words(url: str, session: Optional[requests.Session] = None) -> List[str]:
+    """Stream a newline-separated wordlist from a URL."""
+    getter = session or requests
+    with getter.get(url, stream=True) as response:
+        response.raise_for_status()
+        # Raw text URLs may omit the charset; decode_unicode needs an encoding
+        response.encoding = response.encoding or "utf-8"
+        return [
+            line.strip()
+            for line in response.iter_lines(decode_unicode=True)
+            if line.strip()
+        ]
+
+
+def download_bip39(session: Optional[requests.Session] = None) -> List[str]:
     """Download BIP39 English wordlist."""
-    url = "https://raw.githubusercontent.com/bitcoin/bips/master/bip-0039/english.txt"
-    print(f"Downloading BIP39 wordlist from {url}...")
-    
-    response = requests.get(url)
-    response.raise_for_status()
+    print(f"Downloading BIP39 wordlist from {BIP39_URL}...")
     
-    words = [word.strip() for word in response.text.strip().split('\n')]
+    words = fetch_words(BIP39_URL, session)
     print(f"Downloaded {len(words)} BIP39 words")
     return words
 
 
-def download_top_english() -> List[str]:
+def download_top_english(session: Optional[requests.Session] = None) -> List[str]:
     """Download top 100,000 English words."""
-    url = "https://raw.githubusercontent.com/david47k/top-english-wordlists/master/top_english_words_lower_100000.txt"
-    print(f"Downloading top English words from {url}...")
+    print(f"Downloading top English words from {TOP_ENGLISH_URL}...")
     
-    response = requests.get(url)
-    response.raise_for_status()
-    
-    words = [word.strip() for word in response.text.strip().split('\n')]
+    words = fetch_words(TOP_ENGLISH_URL, session)
     print(f"Downloaded {len(words)} top English words")
     return words
 
 
+def download_all() -> tuple[List[str], List[str]]:
+    """Download both source wordlists concurrently over one pooled session."""
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=2) as executor:
+        bip39_future = executor.submit(download_bip39, session)
+        top_english_future = executor.submit(download_top_english, session)
+        return bip39_future.result(), top_english_future.result()
+
+
+def read_wordlist(path: Path, lowercase: bool = False) -> List[str]:
+    """Read a wordlist with one word per line, skipping blank lines."""
+    # Lowercasing the whole text at once replaces a lower() call per word
+    text = path.read_text()
+    if lowercase:
+        text = text.lower()
+    return [line.strip() for line in text.split("\n") if line.strip()]
+
+
+def save_json(data: Any, path: Path, compact: bool = False) -> None:
+    """Save data as JSON, using orjson when it is installed.
+    
+    Output is indented unless compact is set, which drops all whitespace
+    for machine-read files. Non-string keys (e.g. Counter length
+    distributions) become strings, as they do with the json module.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(data, option=option))
+    elif compact:
+        with open(path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
 def save_wordlist(words: List[str], filename: str) -> None:
     """Save wordlist to file."""
     output_dir = Path("wordlists")
@@ -61,12 +115,8 @@ def main():
     """Download all source wordlists."""
     print("Downloading source wordlists...\n")
     
-    # Download BIP39
-    bip39_words = download_bip39()
+    bip39_words, top_english = download_all()
     save_wordlist(bip39_words, "bip39_english.txt")
-    
-    # Download top English words
-    top_english = download_top_english()
     save_wordlist(top_english, "top_english_100000.txt")
     
     print("\nAll wordlists downloaded successfully!")
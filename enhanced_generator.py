@@ -15,8 +15,10 @@ UV Dependencies:
 # ]
 # ///
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Set, Tuple
+import heapq
 import json
 import re
 from collections import Counter
@@ -26,6 +28,18 @@ from generate_wordlist import load_or_download_words, save_wordlist
 
 
 TARGET_SIZE = 65536  # 2^16
+CHUNK_SIZE = 2000  # Candidates per worker task
+
+# Any letter repeated three times in a row, scanned in C rather than a loop
+TRIPLE_LETTER = re.compile(r'(.)\1\1')
+
+# Quality tiers as (minimum score, name), checked from best to worst
+_TIERS: tuple[tuple[float, str], ...] = (
+    (0.9, "excellent"),
+    (0.8, "very_good"),
+    (0.7, "good"),
+    (0.6, "acceptable"),
+)
 
 
 class EnhancedWordFilter:
@@ -58,9 +72,8 @@ class EnhancedWordFilter:
             return False
         
         # No repeated letters more than twice
-        for i in range(len(word) - 2):
-            if word[i] == word[i+1] == word[i+2]:
-                return False
+        if TRIPLE_LETTER.search(word):
+            return False
         
         # No words that are just repeated patterns
         if len(set(word)) < len(word) * 0.4:  # At least 40% unique letters
@@ -77,26 +90,17 @@ class EnhancedWordFilter:
     def categorize_word(self, word: str) -> Tuple[str, float]:
         """Categorize word by quality tier."""
         score = self.scorer.score_word(word)
+        total = score.total_score
         
-        # Tier 1: Excellent (score >= 0.9, no issues)
-        if score.total_score >= 0.9 and not score.reasons:
-            return "excellent", score.total_score
-        
-        # Tier 2: Very Good (score >= 0.8)
-        elif score.total_score >= 0.8:
-            return "very_good", score.total_score
-        
-        # Tier 3: Good (score >= 0.7)
-        elif score.total_score >= 0.7:
-            return "good", score.total_score
+        # Excellent additionally requires that no issues were flagged
+        if total >= 0.9 and not score.reasons:
+            return "excellent", total
         
-        # Tier 4: Acceptable (score >= 0.6)
-        elif score.total_score >= 0.6:
-            return "acceptable", score.total_score
+        for threshold, name in _TIERS[1:]:
+            if total >= threshold:
+                return name, total
         
-        # Tier 5: Poor (below 0.6)
-        else:
-            return "poor", score.total_score
+        return "poor", total
     
     def filter_by_phonetics(self, word: str) -> bool:
         """Apply phonetic filters."""
@@ -144,6 +148,34 @@ class EnhancedWordFilter:
         return True
 
 
+def _categorize_chunk(
+    words: List[str], existing: Set[str]
+) -> List[Tuple[str, str, float]]:
+    """Filter and categorize a chunk of candidates in a worker process."""
+    filter = EnhancedWordFilter()
+    results = []
+    
+    for word in words:
+        word = word.lower().strip()
+        
+        if word in existing:
+            continue
+        
+        if not filter.is_valid_word(word):
+            continue
+        
+        if not filter.filter_by_phonetics(word):
+            continue
+        
+        if not filter.filter_homophones(word, existing):
+            continue
+        
+        category, score = filter.categorize_word(word)
+        results.append((category, word, score))
+    
+    return results
+
+
 def generate_enhanced_wordlist() -> List[str]:
     """Generate wordlist with enhanced quality controls."""
     filter = EnhancedWordFilter()
@@ -158,36 +190,32 @@ def generate_enhanced_wordlist() -> List[str]:
     
     # Categorize all candidate words
     print("\nCategorizing candidate words by quality...")
+    candidates = top_english[:80000]  # Process more words
+    
     categorized = {
         "excellent": [],
         "very_good": [],
         "good": [],
-        "acceptable": [],
-        "poor": []
+        "acceptable": []
     }
     
+    # Classify chunks in parallel; only the BIP39 set is consulted, so chunks
+    # are independent and ex.map keeps their original order
+    chunks = [
+        candidates[i:i + CHUNK_SIZE]
+        for i in range(0, len(candidates), CHUNK_SIZE)
+    ]
     processed = 0
-    for word in top_english[:80000]:  # Process more words
-        word = word.lower().strip()
-        
-        if word in final_words:
-            continue
-        
-        if not filter.is_valid_word(word):
-            continue
-        
-        if not filter.filter_by_phonetics(word):
-            continue
-        
-        if not filter.filter_homophones(word, final_words):
-            continue
-        
-        category, score = filter.categorize_word(word)
-        if category != "poor":
-            categorized[category].append((word, score))
-        
-        processed += 1
-        if processed % 5000 == 0:
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            _categorize_chunk, chunks, [final_words] * len(chunks)
+        )
+        for chunk, chunk_result in zip(chunks, results):
+            for category, word, score in chunk_result:
+                if category != "poor":
+                    categorized[category].append((word, score))
+            
+            processed += len(chunk)
             print(f"Processed {processed} words...")
     
     # Sort each category by score
@@ -216,8 +244,11 @@ def generate_enhanced_wordlist() -> List[str]:
         if len(final_words) >= TARGET_SIZE:
             break
     
-    # Convert to sorted list
-    wordlist = sorted(list(final_words))[:TARGET_SIZE]
+    # Convert to sorted list, using a bounded heap if we overshot the target
+    if len(final_words) > TARGET_SIZE:
+        wordlist = heapq.nsmallest(TARGET_SIZE, final_words)
+    else:
+        wordlist = sorted(final_words)
     
     return wordlist
 
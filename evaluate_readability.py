@@ -11,42 +11,190 @@ UV Dependencies:
 # requires-python = ">=3.11"
 # dependencies = [
 #     "requests>=2.31.0",
+#     "numpy>=1.26.0",
 # ]
 # ///
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import random
-from typing import List, Tuple
+import math
+from typing import Iterator, List, Optional, Tuple
 import json
 
-from word_scorer import WordScorer
+import numpy as np
+
 from claude_optimized_generator import ClaudeOptimizedFilter
+from download_sources import read_wordlist
+from word_scorer import _codes, pack_words
+
+
+VOWEL_CODES = _codes('aeiou')
+
+# Packed words as a zero-padded (N, width) code point matrix and a length vector
+PackedWords = Tuple[np.ndarray, np.ndarray]
+
+# Minimum matrix width so the fixed-position slices in the pattern and typing
+# tests (CVCV, longest prefix, adjacent pairs) are always in range
+PACK_MIN_WIDTH = 5
+
+# Seed for the word samples, so evaluations are reproducible run to run
+SAMPLE_SEED = 0xC0FFEE
+
+# Rows per broadcast block when comparing words within a similarity bucket
+SIMILARITY_CHUNK = 512
+
+
+def _sample_rows(count: int, sample_size: int) -> np.ndarray:
+    """Draw a reproducible sample of row indices without replacement."""
+    rng = np.random.default_rng(SAMPLE_SEED)
+    return rng.choice(count, size=min(sample_size, count), replace=False)
+
+
+def _similarity_blocks(length: int) -> List[Tuple[int, int]]:
+    """Split the first `length` positions into blocks for candidate bucketing.
+    
+    A similar pair whose shorter word has this length can mismatch in at most
+    `length - ceil(0.6 * length)` positions, so with one more block than that
+    at least one block must match exactly (pigeonhole).
+    
+    >>> _similarity_blocks(5)
+    [(0, 2), (2, 4), (4, 5)]
+    """
+    count = length - math.ceil(0.6 * length - 1e-9) + 1
+    blocks = []
+    start = 0
+    for i in range(count):
+        stop = start + length // count + (1 if i < length % count else 0)
+        blocks.append((start, stop))
+        start = stop
+    return blocks
+
+
+def _count_bucket_pairs(matrix: np.ndarray, lens: np.ndarray, members: np.ndarray,
+                        length: int, block: int) -> int:
+    """Count similar pairs in one bucket whose shorter word has `length` letters.
+    
+    Members are in list order, so each pair is tested against the earlier
+    word's length. A pair is only counted in the first block it matches in.
+    """
+    blocks = _similarity_blocks(length)[:block]
+    sub = matrix[members, :length]
+    sub_lens = lens[members]
+    m = len(members)
+    count = 0
+    
+    for row in range(0, m, SIMILARITY_CHUNK):
+        rows = slice(row, min(row + SIMILARITY_CHUNK, m))
+        same = sub[rows, None, :] == sub[None, :, :]
+        
+        pairs = np.arange(rows.start, rows.stop)[:, None] < np.arange(m)[None, :]
+        pairs &= (sub_lens[rows, None] == length) | (sub_lens[None, :] == length)
+        pairs &= same.sum(axis=-1) >= sub_lens[rows, None] * 0.6
+        for start, stop in blocks:
+            pairs &= ~same[..., start:stop].all(axis=-1)
+        
+        count += int(pairs.sum())
+    
+    return count
 
 
-def phonetic_similarity_test(words: List[str], sample_size: int = 100) -> float:
-    """Test how distinct words are from each other phonetically."""
-    # Sample random pairs
-    sample_words = random.sample(words, min(sample_size, len(words)))
+def phonetic_similarity_test(words: List[str],
+                             packed: Optional[PackedWords] = None) -> float:
+    """Test how distinct words are from each other phonetically.
+    
+    Every pair of words in the list is considered. Pairs are similar when
+    their lengths differ by at most one and at least 60% of the first word's
+    letters match position by position. Instead of comparing all N^2 pairs,
+    words are bucketed on exact blocks of positions and only pairs sharing a
+    bucket are compared; see `_similarity_blocks` for why none are missed.
     
+    `packed` may be passed to reuse a matrix already built with `pack_words`.
+    """
+    n = len(words)
+    if n < 2:
+        return 1.0
+    
+    matrix, lens = packed if packed is not None else pack_words(words)
     similar_pairs = 0
-    total_pairs = 0
     
-    for i in range(len(sample_words)):
-        for j in range(i + 1, len(sample_words)):
-            word1, word2 = sample_words[i], sample_words[j]
-            
-            # Check for similar patterns that could cause confusion
-            if (abs(len(word1) - len(word2)) <= 1 and
-                sum(c1 == c2 for c1, c2 in zip(word1, word2)) >= len(word1) * 0.6):
-                similar_pairs += 1
+    for length in np.unique(lens):
+        length = int(length)
+        members = np.flatnonzero((lens == length) | (lens == length + 1))
+        if len(members) < 2:
+            continue
+        
+        for block, (start, stop) in enumerate(_similarity_blocks(length)):
+            # Group members by their letters in this block, keeping list order
+            _, bucket = np.unique(matrix[members, start:stop], axis=0,
+                                  return_inverse=True)
+            bucket = bucket.reshape(-1)
+            order = np.argsort(bucket, kind='stable')
+            bounds = np.flatnonzero(np.diff(bucket[order])) + 1
             
-            total_pairs += 1
+            for group in np.split(members[order], bounds):
+                if len(group) > 1:
+                    similar_pairs += _count_bucket_pairs(
+                        matrix, lens, group, length, block
+                    )
+    
+    total_pairs = n * (n - 1) // 2
     
     # Return distinctiveness score (higher is better)
-    return 1.0 - (similar_pairs / total_pairs) if total_pairs > 0 else 1.0
+    return 1.0 - (similar_pairs / total_pairs)
+
+
+def _build_trie(patterns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build an anchored trie over ASCII as a DFA transition table.
+    
+    Returns a (states, 128) table where state 0 is the dead state and state 1
+    the root, and a mask of the states that complete a pattern. Because the
+    patterns are anchored this is Aho-Corasick without failure links.
+    """
+    transitions = [[0] * 128, [0] * 128]
+    terminal = [False, False]
+    
+    for pattern in patterns:
+        state = 1
+        for code in map(ord, pattern):
+            if not transitions[state][code]:
+                transitions.append([0] * 128)
+                terminal.append(False)
+                transitions[state][code] = len(transitions) - 1
+            state = transitions[state][code]
+        terminal[state] = True
+    
+    return np.array(transitions, dtype=np.int32), np.array(terminal)
 
 
-def common_pattern_test(words: List[str]) -> dict:
+def _trie_hits(trie: Tuple[np.ndarray, np.ndarray], columns: Iterator[np.ndarray],
+               lens: np.ndarray) -> np.ndarray:
+    """Mask of words matching a trie pattern with at least three letters left over.
+    
+    `columns` yields one code point per word for each step of the walk. All
+    words advance together and the walk stops once every word is dead.
+    """
+    transitions, terminal = trie
+    state = np.ones(len(lens), dtype=np.int32)
+    hits = np.zeros(len(lens), dtype=bool)
+    
+    for depth, column in enumerate(columns, 1):
+        state = transitions[state, np.minimum(column, 127)]
+        if not state.any():
+            break
+        hits |= terminal[state] & (lens > depth + 2)
+    
+    return hits
+
+
+# Affixes for the pattern test, compiled once into tries (suffixes reversed)
+COMMON_PREFIXES = ('un', 're', 'in', 'dis', 'pre', 'over', 'under', 'out')
+COMMON_SUFFIXES = ('ing', 'ed', 'er', 'est', 'ly', 'tion', 'ment', 'ness')
+PREFIX_TRIE = _build_trie(list(COMMON_PREFIXES))
+SUFFIX_TRIE = _build_trie([suffix[::-1] for suffix in COMMON_SUFFIXES])
+
+
+def common_pattern_test(words: List[str],
+                        packed: Optional[PackedWords] = None) -> dict:
     """Test how many words follow common English patterns."""
     patterns = {
         "CVC": 0,  # consonant-vowel-consonant
@@ -56,58 +204,86 @@ def common_pattern_test(words: List[str]) -> dict:
         "simple_plural": 0,  # -s, -es
     }
     
-    vowels = set('aeiou')
-    common_prefixes = ['un', 're', 'in', 'dis', 'pre', 'over', 'under', 'out']
-    common_suffixes = ['ing', 'ed', 'er', 'est', 'ly', 'tion', 'ment', 'ness']
-    
-    for word in words:
-        # Check CVC pattern
-        if (len(word) == 3 and 
-            word[0] not in vowels and 
-            word[1] in vowels and 
-            word[2] not in vowels):
-            patterns["CVC"] += 1
-        
-        # Check CVCV pattern
-        if len(word) == 4:
-            is_cvcv = True
-            for i in range(4):
-                if i % 2 == 0 and word[i] in vowels:
-                    is_cvcv = False
-                elif i % 2 == 1 and word[i] not in vowels:
-                    is_cvcv = False
-            if is_cvcv:
-                patterns["CVCV"] += 1
-        
-        # Check prefixes
-        for prefix in common_prefixes:
-            if word.startswith(prefix) and len(word) > len(prefix) + 2:
-                patterns["common_prefix"] += 1
-                break
-        
-        # Check suffixes
-        for suffix in common_suffixes:
-            if word.endswith(suffix) and len(word) > len(suffix) + 2:
-                patterns["common_suffix"] += 1
-                break
-        
-        # Check simple plurals
-        if word.endswith('s') and not word.endswith('ss'):
-            patterns["simple_plural"] += 1
+    total = len(words)
+    if total == 0:
+        return {k: 0.0 for k in patterns}
+    
+    if packed is None:
+        packed = pack_words(words, PACK_MIN_WIDTH)
+    matrix, lens = packed
+    is_vowel = np.isin(matrix, VOWEL_CODES)
+    rows = np.arange(total)[:, None]
+    
+    def ends_with(suffix: str) -> np.ndarray:
+        """Mask of words ending in suffix, gathered from each word's tail."""
+        k = len(suffix)
+        positions = np.clip(lens[:, None] - k + np.arange(k), 0, None)
+        tails = matrix[rows, positions]
+        return (lens >= k) & (tails == _codes(suffix)).all(axis=1)
+    
+    # Check CVC pattern
+    cvc = (lens == 3) & ~is_vowel[:, 0] & is_vowel[:, 1] & ~is_vowel[:, 2]
+    patterns["CVC"] = int(cvc.sum())
+    
+    # Check CVCV pattern
+    cvcv = ((lens == 4) & ~is_vowel[:, 0] & is_vowel[:, 1] &
+            ~is_vowel[:, 2] & is_vowel[:, 3])
+    patterns["CVCV"] = int(cvcv.sum())
+    
+    # Check prefixes, walking one trie over the leading columns
+    prefix_columns = (matrix[:, i] for i in range(matrix.shape[1]))
+    has_prefix = _trie_hits(PREFIX_TRIE, prefix_columns, lens)
+    patterns["common_prefix"] = int(has_prefix.sum())
+    
+    # Check suffixes, walking a trie of reversed suffixes back from each end
+    suffix_columns = (
+        np.where(lens > i, matrix[rows[:, 0], np.maximum(lens - 1 - i, 0)], 0)
+        for i in range(matrix.shape[1])
+    )
+    has_suffix = _trie_hits(SUFFIX_TRIE, suffix_columns, lens)
+    patterns["common_suffix"] = int(has_suffix.sum())
+    
+    # Check simple plurals
+    patterns["simple_plural"] = int((ends_with('s') & ~ends_with('ss')).sum())
     
     # Convert to percentages
-    total = len(words)
     return {k: (v / total) * 100 for k, v in patterns.items()}
 
 
-def typing_ease_test(words: List[str], sample_size: int = 1000) -> dict:
-    """Test how easy words are to type on a QWERTY keyboard."""
-    # Define keyboard rows
-    top_row = set('qwertyuiop')
-    middle_row = set('asdfghjkl')
-    bottom_row = set('zxcvbnm')
+def _ascii_table(groups: List[str]) -> np.ndarray:
+    """Map ASCII code points to the index of the group containing them, else -1."""
+    table = np.full(128, -1, dtype=np.int8)
+    for index, letters in enumerate(groups):
+        table[_codes(letters)] = index
+    return table
+
+
+# Keyboard rows (top, middle, bottom) and hands (left, right, simplified);
+# non-ASCII code points are clipped to DEL, which maps to -1
+KEYBOARD_ROWS = _ascii_table(['qwertyuiop', 'asdfghjkl', 'zxcvbnm'])
+KEYBOARD_HANDS = _ascii_table(['qwertasdfgzxcvb', 'yuiophjklnm'])
+
+# Common bigrams in English, packed as (c1 << 32) | c2 keys
+COMMON_BIGRAMS = frozenset({
+    'th', 'he', 'in', 'er', 'an', 're', 'ed', 'on', 'es', 'st',
+    'en', 'at', 'to', 'nt', 'ha', 'nd', 'ou', 'ea', 'ng', 'as',
+})
+BIGRAM_KEYS = np.array(
+    sorted((ord(a) << 32) | ord(b) for a, b in COMMON_BIGRAMS), dtype=np.uint64
+)
+
+
+def typing_ease_test(words: List[str], sample_size: int = 1000,
+                     packed: Optional[PackedWords] = None,
+                     sample_rows: Optional[np.ndarray] = None) -> dict:
+    """Test how easy words are to type on a QWERTY keyboard.
     
-    sample_words = random.sample(words, min(sample_size, len(words)))
+    `sample_rows` may be passed to reuse a sample drawn by the caller;
+    otherwise one is drawn with `_sample_rows`.
+    """
+    # Sample row indices so a matrix packed by the caller can be reused
+    if sample_rows is None:
+        sample_rows = _sample_rows(len(words), sample_size)
     
     stats = {
         "single_row": 0,  # Words typed on a single row
@@ -116,45 +292,37 @@ def typing_ease_test(words: List[str], sample_size: int = 1000) -> dict:
         "common_bigrams": 0,  # Words with common letter pairs
     }
     
-    # Common bigrams in English
-    common_bigrams = {'th', 'he', 'in', 'er', 'an', 're', 'ed', 'on', 'es', 'st',
-                      'en', 'at', 'to', 'nt', 'ha', 'nd', 'ou', 'ea', 'ng', 'as'}
-    
-    # Left and right hand keys (simplified)
-    left_hand = set('qwertasdfgzxcvb')
-    right_hand = set('yuiophjklnm')
-    
-    for word in sample_words:
-        word_lower = word.lower()
+    if len(sample_rows):
+        if packed is None:
+            packed = pack_words(words, PACK_MIN_WIDTH)
+        matrix, lens = packed[0][sample_rows], packed[1][sample_rows]
+        upper = (matrix >= ord('A')) & (matrix <= ord('Z'))
+        lower = np.where(upper, matrix + 32, matrix)
+        ascii_lower = np.minimum(lower, 127)
+        
+        positions = np.arange(matrix.shape[1])
+        valid = positions < lens[:, None]
+        valid_pair = positions[:-1] < (lens[:, None] - 1)
         
         # Check single row
-        word_chars = set(word_lower)
-        if word_chars.issubset(top_row) or word_chars.issubset(middle_row) or word_chars.issubset(bottom_row):
-            stats["single_row"] += 1
+        rows = KEYBOARD_ROWS[ascii_lower]
+        same_row = (rows == rows[:, :1]) & (rows[:, :1] >= 0)
+        stats["single_row"] = int(((same_row | ~valid).all(axis=1)).sum())
         
         # Check alternating hands
-        if len(word) >= 3:
-            alternates = True
-            for i in range(len(word) - 1):
-                char1, char2 = word_lower[i], word_lower[i + 1]
-                if ((char1 in left_hand and char2 in left_hand) or
-                    (char1 in right_hand and char2 in right_hand)):
-                    alternates = False
-                    break
-            if alternates:
-                stats["alternating_hands"] += 1
+        hands = KEYBOARD_HANDS[ascii_lower]
+        same_hand = (hands[:, :-1] == hands[:, 1:]) & (hands[:, 1:] >= 0)
+        alternates = ~(same_hand & valid_pair).any(axis=1)
+        stats["alternating_hands"] = int((alternates & (lens >= 3)).sum())
         
         # Check repeated letters
-        for i in range(len(word) - 1):
-            if word[i] == word[i + 1]:
-                stats["repeated_letters"] += 1
-                break
+        repeated = (matrix[:, :-1] == matrix[:, 1:]) & valid_pair
+        stats["repeated_letters"] = int(repeated.any(axis=1).sum())
         
         # Check common bigrams
-        for i in range(len(word) - 1):
-            if word_lower[i:i+2] in common_bigrams:
-                stats["common_bigrams"] += 1
-                break
+        pairs = (lower[:, :-1].astype(np.uint64) << 32) | lower[:, 1:]
+        has_bigram = np.isin(pairs, BIGRAM_KEYS) & valid_pair
+        stats["common_bigrams"] = int(has_bigram.any(axis=1).sum())
     
     # Convert to percentages
     return {k: (v / sample_size) * 100 for k, v in stats.items()}
@@ -164,29 +332,25 @@ def evaluate_wordlist(words: List[str], name: str) -> dict:
     """Comprehensive evaluation of a wordlist."""
     print(f"\nEvaluating {name}...")
     
-    scorer = WordScorer()
     optimizer = ClaudeOptimizedFilter()
+    scorer = optimizer.base_filter.scorer
     
-    # Score distribution
-    scores = []
-    premium_count = 0
+    # One seeded sample shared by the scoring pass and the typing test
+    sample_rows = _sample_rows(len(words), 1000)
+    sample = [words[i] for i in sample_rows]
     
-    sample = random.sample(words, min(1000, len(words)))
-    for word in sample:
-        score = scorer.score_word(word)
-        scores.append(score.total_score)
-        
-        # Check if it would be premium in Claude's system
-        features = optimizer.analyze_word(word)
-        if features.overall_score >= 1.5:
-            premium_count += 1
+    # Score distribution, computed for the whole sample in one batch
+    scores = scorer.score_words(sample)
+    avg_score = float(scores.mean())
     
-    avg_score = sum(scores) / len(scores)
+    # Check how many would be premium in Claude's system
+    premium_count = sum(optimizer.is_premium(word) for word in sample)
     
-    # Run tests
-    distinctiveness = phonetic_similarity_test(words, 200)
-    patterns = common_pattern_test(words)
-    typing = typing_ease_test(words, 500)
+    # Run tests, packing the list once for all of them
+    packed = pack_words(words, PACK_MIN_WIDTH)
+    distinctiveness = phonetic_similarity_test(words, packed)
+    patterns = common_pattern_test(words, packed)
+    typing = typing_ease_test(words, 500, packed, sample_rows[:500])
     
     return {
         "name": name,
@@ -212,17 +376,18 @@ def main():
     ]:
         path = Path("output") / filename
         if path.exists():
-            with open(path) as f:
-                wordlists[name] = [line.strip() for line in f if line.strip()]
+            wordlists[name] = read_wordlist(path)
     
     if not wordlists:
         print("No wordlists found! Please run the generators first.")
         return
     
-    # Evaluate each wordlist
-    results = {}
-    for name, words in wordlists.items():
-        results[name] = evaluate_wordlist(words, name)
+    # Evaluate the wordlists in parallel; each one is independent
+    with ProcessPoolExecutor(max_workers=len(wordlists)) as executor:
+        results = dict(zip(
+            wordlists,
+            executor.map(evaluate_wordlist, wordlists.values(), wordlists.keys())
+        ))
     
     # Display results
     print("\n\nEvaluation Results")
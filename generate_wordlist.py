@@ -16,18 +16,23 @@ UV Dependencies:
 # ///
 
 from pathlib import Path
-from typing import List, Set
-import json
+from typing import Iterable, Iterator, List, Optional, Set
+import heapq
 
 from word_scorer import WordScorer, WordScore
-from download_sources import download_bip39, download_top_english, save_wordlist
+from download_sources import download_all, read_wordlist, save_json, save_wordlist
 
 
 TARGET_SIZE = 65536  # 2^16
+FREQUENT_WORDS = 50000  # Top English words preferred over the rarer tail
 
 
 def load_or_download_words() -> tuple[List[str], List[str]]:
-    """Load wordlists from disk or download if needed."""
+    """Load wordlists from disk or download if needed.
+    
+    Words are returned stripped and lowercased, normalized once here rather
+    than by every caller.
+    """
     wordlist_dir = Path("wordlists")
     bip39_path = wordlist_dir / "bip39_english.txt"
     top_english_path = wordlist_dir / "top_english_100000.txt"
@@ -35,32 +40,34 @@ def load_or_download_words() -> tuple[List[str], List[str]]:
     # Download if files don't exist
     if not bip39_path.exists() or not top_english_path.exists():
         print("Wordlists not found. Downloading...")
-        bip39_words = download_bip39()
+        bip39_words, top_english = download_all()
         save_wordlist(bip39_words, "bip39_english.txt")
-        
-        top_english = download_top_english()
         save_wordlist(top_english, "top_english_100000.txt")
+        bip39_words = [word.lower() for word in bip39_words]
+        top_english = [word.lower() for word in top_english]
     else:
         # Load from disk
-        with open(bip39_path) as f:
-            bip39_words = [line.strip() for line in f if line.strip()]
-        
-        with open(top_english_path) as f:
-            top_english = [line.strip() for line in f if line.strip()]
+        bip39_words = read_wordlist(bip39_path, lowercase=True)
+        top_english = read_wordlist(top_english_path, lowercase=True)
     
     return bip39_words, top_english
 
 
-def filter_candidates(words: List[str], existing: Set[str], scorer: WordScorer) -> List[tuple[str, float]]:
-    """Filter and score candidate words."""
-    candidates = []
+def _scored_candidates(words: Iterable[str], existing: Set[str],
+                       scorer: WordScorer) -> Iterator[tuple[str, float]]:
+    """Yield unique (word, score) pairs that pass the basic filters.
+    
+    Words must already be normalized, as load_or_download_words returns them.
+    The cheap filters run per word; survivors are then scored in one batch.
+    """
+    seen: Set[str] = set()
+    survivors = []
     
     for word in words:
-        word = word.lower().strip()
-        
-        # Skip if already in set
-        if word in existing:
+        # Skip if already in set or already seen in this pass
+        if word in existing or word in seen:
             continue
+        seen.add(word)
         
         # Basic filters
         if len(word) < 3 or len(word) > 10:
@@ -70,14 +77,30 @@ def filter_candidates(words: List[str], existing: Set[str], scorer: WordScorer)
         if not word.isalpha():
             continue
         
-        # Score the word
-        if scorer.is_good_word(word, threshold=0.6):
-            score = scorer.score_word(word)
-            candidates.append((word, score.total_score))
+        survivors.append(word)
     
-    # Sort by score (highest first)
-    candidates.sort(key=lambda x: x[1], reverse=True)
-    return candidates
+    # Score the survivors together and apply the threshold
+    scores = scorer.score_words(survivors)
+    for word, score in zip(survivors, scores.tolist()):
+        if score >= 0.6:
+            yield word, score
+
+
+def filter_candidates(words: List[str], existing: Set[str], scorer: WordScorer,
+                      limit: Optional[int] = None) -> List[tuple[str, float]]:
+    """Filter and score normalized candidate words.
+    
+    Returns unique (word, score) pairs, highest score first. When `limit` is
+    given, candidates are streamed into a heap bounded at `limit` entries, so
+    the rejected tail is never collected or sorted.
+    """
+    candidates = _scored_candidates(words, existing, scorer)
+    
+    # Highest score first; nlargest keeps ties in input order like a stable sort
+    if limit is not None:
+        return heapq.nlargest(limit, candidates, key=lambda x: x[1])
+    
+    return sorted(candidates, key=lambda x: x[1], reverse=True)
 
 
 def generate_wordlist() -> List[str]:
@@ -92,12 +115,14 @@ def generate_wordlist() -> List[str]:
     final_words = set(bip39_words)
     print(f"Starting with {len(final_words)} BIP39 words")
     
-    # Score and filter candidates from top English words
+    # Score the most frequent top English words once and keep the best needed
     print("\nAnalyzing top English words...")
-    candidates = filter_candidates(top_english[:50000], final_words, scorer)
+    words_needed = TARGET_SIZE - len(final_words)
+    candidates = filter_candidates(
+        top_english[:FREQUENT_WORDS], final_words, scorer, limit=words_needed
+    )
     
     # Add best candidates until we reach target size
-    words_needed = TARGET_SIZE - len(final_words)
     print(f"\nNeed to add {words_needed} more words")
     
     added = 0
@@ -111,27 +136,18 @@ def generate_wordlist() -> List[str]:
         if added % 1000 == 0:
             print(f"Added {added} words... (total: {len(final_words)})")
     
-    # If we still need more words, lower the threshold
+    # Only fall back to the rarer tail if the frequent words came up short
     if len(final_words) < TARGET_SIZE:
-        print(f"\nStill need {TARGET_SIZE - len(final_words)} words. Lowering threshold...")
+        print(f"\nStill need {TARGET_SIZE - len(final_words)} words. Using less frequent words...")
         
-        # Re-analyze with lower threshold
-        scorer_relaxed = WordScorer()
         remaining_candidates = filter_candidates(
-            top_english[50000:], 
-            final_words, 
-            scorer_relaxed
+            top_english[FREQUENT_WORDS:], final_words, scorer,
+            limit=TARGET_SIZE - len(final_words)
         )
-        
-        for word, score in remaining_candidates:
-            if len(final_words) >= TARGET_SIZE:
-                break
-            
-            if score >= 0.5:  # Lower threshold
-                final_words.add(word)
+        final_words.update(word for word, score in remaining_candidates)
     
-    # Convert to sorted list
-    wordlist = sorted(list(final_words))
+    # Convert to sorted list; sorted() materializes the set only once
+    wordlist = sorted(final_words)
     
     # Ensure we have exactly the target size
     if len(wordlist) > TARGET_SIZE:
@@ -161,8 +177,7 @@ def save_final_wordlist(words: List[str]) -> None:
         "includes_bip39": True,
         "words": words
     }
-    with open(json_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    save_json(metadata, json_path)
     print(f"Saved metadata to {json_path}")
 
 
@@ -12,24 +12,131 @@ UV Dependencies:
 # dependencies = [
 #     "requests>=2.31.0",
 #     "nltk>=3.8.1",
+#     "numpy>=1.26.0",
 # ]
 # ///
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set, Dict, Tuple
-import json
+from typing import List, Dict, Tuple, Optional
+import heapq
 import re
 from collections import Counter
+from itertools import chain
 from dataclasses import dataclass
 
-from word_scorer import WordScorer
+import numpy as np
+
+from word_scorer import WordScorer, pack_words
+from download_sources import save_json
 from generate_wordlist import load_or_download_words, save_wordlist
 
 
 TARGET_SIZE = 65536  # 2^16
+CHUNK_SIZE = 2000  # Candidates per worker task
+
+VOWELS = frozenset('aeiou')
+CONSONANTS = frozenset('bcdfghjklmnpqrstvwxz')
+UNCOMMON_LETTERS = frozenset('qxzj')
+
+# Curated vocabulary of high-quality English words by category
+PREMIUM_CATEGORIES: dict[str, list[str]] = {
+    # Basic objects (household, everyday items)
+    'objects': [
+        'table', 'chair', 'bed', 'door', 'window', 'wall', 'floor', 'roof', 'house', 'room',
+        'book', 'pen', 'paper', 'phone', 'clock', 'lamp', 'mirror', 'picture', 'bottle', 'cup',
+        'plate', 'spoon', 'fork', 'knife', 'bowl', 'glass', 'box', 'bag', 'key', 'lock',
+        'car', 'bike', 'bus', 'train', 'plane', 'boat', 'road', 'bridge', 'tree', 'flower',
+        'stone', 'rock', 'hill', 'mountain', 'river', 'lake', 'beach', 'forest', 'field', 'garden'
+    ],
+
+    # Body parts
+    'body': [
+        'head', 'face', 'eye', 'ear', 'nose', 'mouth', 'tooth', 'tongue', 'lip', 'chin',
+        'neck', 'shoulder', 'arm', 'hand', 'finger', 'thumb', 'chest', 'back', 'stomach', 'leg',
+        'knee', 'foot', 'toe', 'skin', 'hair', 'bone', 'muscle', 'heart', 'brain', 'blood'
+    ],
+
+    # Animals
+    'animals': [
+        'cat', 'dog', 'bird', 'fish', 'horse', 'cow', 'pig', 'sheep', 'goat', 'chicken',
+        'duck', 'rabbit', 'mouse', 'bear', 'lion', 'tiger', 'elephant', 'monkey', 'snake', 'frog',
+        'bee', 'ant', 'spider', 'fly', 'worm', 'whale', 'shark', 'eagle', 'owl', 'deer'
+    ],
+
+    # Colors
+    'colors': [
+        'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink', 'brown', 'black', 'white',
+        'gray', 'grey', 'gold', 'silver', 'dark', 'light', 'bright', 'pale', 'deep', 'clear'
+    ],
+
+    # Common actions
+    'actions': [
+        'go', 'come', 'walk', 'run', 'jump', 'sit', 'stand', 'lie', 'sleep', 'wake',
+        'eat', 'drink', 'cook', 'clean', 'wash', 'dry', 'open', 'close', 'push', 'pull',
+        'take', 'give', 'put', 'get', 'make', 'break', 'fix', 'build', 'cut', 'fold',
+        'read', 'write', 'speak', 'listen', 'look', 'see', 'watch', 'think', 'know', 'learn',
+        'teach', 'help', 'work', 'play', 'sing', 'dance', 'laugh', 'cry', 'smile', 'love'
+    ],
+
+    # Time and weather
+    'time_weather': [
+        'day', 'night', 'morning', 'evening', 'week', 'month', 'year', 'time', 'hour', 'minute',
+        'today', 'tomorrow', 'yesterday', 'now', 'then', 'early', 'late', 'quick', 'slow', 'fast',
+        'sun', 'moon', 'star', 'sky', 'cloud', 'rain', 'snow', 'wind', 'hot', 'cold',
+        'warm', 'cool', 'wet', 'dry', 'storm', 'fog', 'ice', 'fire', 'light', 'dark'
+    ],
+
+    # Emotions and qualities
+    'emotions': [
+        'happy', 'sad', 'angry', 'calm', 'excited', 'tired', 'strong', 'weak', 'brave', 'afraid',
+        'kind', 'mean', 'nice', 'good', 'bad', 'right', 'wrong', 'true', 'false', 'real',
+        'big', 'small', 'large', 'little', 'tall', 'short', 'long', 'wide', 'narrow', 'thick',
+        'thin', 'heavy', 'light', 'hard', 'soft', 'rough', 'smooth', 'sharp', 'dull', 'clean'
+    ],
+
+    # Food and drink
+    'food': [
+        'bread', 'meat', 'fish', 'egg', 'milk', 'cheese', 'butter', 'sugar', 'salt', 'pepper',
+        'rice', 'pasta', 'soup', 'salad', 'fruit', 'apple', 'orange', 'banana', 'grape', 'berry',
+        'cake', 'cookie', 'tea', 'coffee', 'water', 'juice', 'wine', 'beer', 'ice', 'honey'
+    ],
+
+    # Common adjectives
+    'adjectives': [
+        'new', 'old', 'young', 'fresh', 'clean', 'dirty', 'empty', 'full', 'open', 'closed',
+        'free', 'busy', 'easy', 'hard', 'simple', 'complex', 'clear', 'cloudy', 'quiet', 'loud',
+        'safe', 'dangerous', 'cheap', 'expensive', 'rich', 'poor', 'healthy', 'sick', 'alive', 'dead'
+    ],
+
+    # Common verbs
+    'verbs': [
+        'be', 'have', 'do', 'say', 'get', 'make', 'know', 'think', 'take', 'see',
+        'come', 'want', 'use', 'find', 'give', 'tell', 'ask', 'work', 'seem', 'feel',
+        'try', 'leave', 'call', 'move', 'live', 'show', 'hear', 'play', 'turn', 'bring'
+    ]
+}
+PREMIUM_WORDS: frozenset[str] = frozenset(chain.from_iterable(PREMIUM_CATEGORIES.values()))
+
+# Words that should definitely be excluded
+EXCLUDED_WORDS: frozenset[str] = frozenset({
+    # Abbreviations and acronyms
+    'aaa', 'aab', 'aac', 'aad', 'aaf', 'aag', 'aah', 'aal', 'aam', 'aan', 'aap', 'aar', 'aas', 'aat', 'aau', 'aav',
+    'bbb', 'ccc', 'ddd', 'eee', 'fff', 'ggg', 'hhh', 'iii', 'jjj', 'kkk', 'lll', 'mmm', 'nnn', 'ooo', 'ppp',
+    'qqq', 'rrr', 'sss', 'ttt', 'uuu', 'vvv', 'www', 'xxx', 'yyy', 'zzz',
 
+    # Place names (proper nouns)
+    'aalborg', 'aalto', 'aachen', 'aarhus', 'aaron', 'aba', 'abadan', 'abaft', 'abajo',
 
-@dataclass
+    # Technical terms and foreign words
+    'abacus', 'abased', 'abashed', 'abate', 'abated', 'abatement', 'abates', 'abating',
+
+    # Very obscure or archaic words
+    'abattoir', 'abba', 'abbas', 'abbasid', 'abbaye', 'abbe', 'abbess', 'abbot',
+})
+
+
+@dataclass(slots=True, frozen=True)
 class WordValidation:
     """Comprehensive word validation results."""
     word: str
@@ -45,25 +152,22 @@ class PremiumWordFilter:
     
     def __init__(self):
         self.scorer = WordScorer()
+        self.validated_words: dict[str, WordValidation] = {}
         
-        # Curated list of high-quality English words by category
-        self.premium_words = self._build_premium_vocabulary()
+        # Shared module-level sets, built once at import
+        self.premium_words = PREMIUM_WORDS
+        self.excluded_words = EXCLUDED_WORDS
         
-        # Patterns that indicate real English words
-        self.valid_patterns = [
-            # Common English morphology
-            r'^[a-z]+(ing|ed|er|est|ly|ness|ment|tion|sion)$',  # Common suffixes
-            r'^(un|re|pre|dis|mis|over|under|out|up|down)[a-z]+$',  # Common prefixes
-            
-            # Common word structures
-            r'^[bcdfghjklmnpqrstvwxz][aeiou][bcdfghjklmnpqrstvwxz]$',  # CVC
-            r'^[bcdfghjklmnpqrstvwxz][aeiou][bcdfghjklmnpqrstvwxz][aeiou]$',  # CVCV
-            r'^[aeiou][bcdfghjklmnpqrstvwxz][aeiou]$',  # VCV
-            r'^[bcdfghjklmnpqrstvwxz][aeiou][bcdfghjklmnpqrstvwxz][aeiou][bcdfghjklmnpqrstvwxz]$',  # CVCVC
-        ]
+        # Common English morphology and word structures that indicate real
+        # English words, matched as literal affixes and vowel/consonant shapes
+        self.valid_suffixes = ('ing', 'ed', 'er', 'est', 'ly', 'ness', 'ment', 'tion', 'sion')
+        self.valid_prefixes = ('un', 're', 'pre', 'dis', 'mis', 'over', 'under', 'out', 'up', 'down')
+        self.valid_shapes = frozenset(['CVC', 'CVCV', 'VCV', 'CVCVC'])
+        self.suffix_matches: dict[str, bool] = {}
+        self.prefix_matches: dict[str, bool] = {}
         
         # Patterns that indicate low-quality or non-English words
-        self.invalid_patterns = [
+        self.invalid_patterns = [re.compile(p) for p in [
             r'^[aeiou]{2,}$',  # Just vowels (aa, aaa, etc.)
             r'^[bcdfghjklmnpqrstvwxz]{2,}$',  # Just consonants
             r'^[aeiou][aeiou][bcdfghjklmnpqrstvwxz]$',  # aab, aac pattern
@@ -76,116 +180,99 @@ class PremiumWordFilter:
             r'[^a-z]',  # Contains non-lowercase letters
             r'^.{1,2}$',  # Too short (1-2 letters)
             r'^.{11,}$',  # Too long (11+ letters)
-        ]
-        
-        # Words that should definitely be excluded
-        self.excluded_words = {
-            # Abbreviations and acronyms
-            'aaa', 'aab', 'aac', 'aad', 'aaf', 'aag', 'aah', 'aal', 'aam', 'aan', 'aap', 'aar', 'aas', 'aat', 'aau', 'aav',
-            'bbb', 'ccc', 'ddd', 'eee', 'fff', 'ggg', 'hhh', 'iii', 'jjj', 'kkk', 'lll', 'mmm', 'nnn', 'ooo', 'ppp',
-            'qqq', 'rrr', 'sss', 'ttt', 'uuu', 'vvv', 'www', 'xxx', 'yyy', 'zzz',
-            
-            # Place names (proper nouns)
-            'aalborg', 'aalto', 'aachen', 'aarhus', 'aaron', 'aba', 'abadan', 'abaft', 'abajo',
-            
-            # Technical terms and foreign words
-            'abacus', 'abased', 'abashed', 'abate', 'abated', 'abatement', 'abates', 'abating',
-            
-            # Very obscure or archaic words
-            'abattoir', 'abba', 'abbas', 'abbasid', 'abbaye', 'abbe', 'abbess', 'abbot',
-        }
-    
-    def _build_premium_vocabulary(self) -> Set[str]:
-        """Build a curated set of high-quality English words."""
-        premium = set()
-        
-        # Core vocabulary categories
-        categories = {
-            # Basic objects (household, everyday items)
-            'objects': [
-                'table', 'chair', 'bed', 'door', 'window', 'wall', 'floor', 'roof', 'house', 'room',
-                'book', 'pen', 'paper', 'phone', 'clock', 'lamp', 'mirror', 'picture', 'bottle', 'cup',
-                'plate', 'spoon', 'fork', 'knife', 'bowl', 'glass', 'box', 'bag', 'key', 'lock',
-                'car', 'bike', 'bus', 'train', 'plane', 'boat', 'road', 'bridge', 'tree', 'flower',
-                'stone', 'rock', 'hill', 'mountain', 'river', 'lake', 'beach', 'forest', 'field', 'garden'
-            ],
-            
-            # Body parts
-            'body': [
-                'head', 'face', 'eye', 'ear', 'nose', 'mouth', 'tooth', 'tongue', 'lip', 'chin',
-                'neck', 'shoulder', 'arm', 'hand', 'finger', 'thumb', 'chest', 'back', 'stomach', 'leg',
-                'knee', 'foot', 'toe', 'skin', 'hair', 'bone', 'muscle', 'heart', 'brain', 'blood'
-            ],
-            
-            # Animals
-            'animals': [
-                'cat', 'dog', 'bird', 'fish', 'horse', 'cow', 'pig', 'sheep', 'goat', 'chicken',
-                'duck', 'rabbit', 'mouse', 'bear', 'lion', 'tiger', 'elephant', 'monkey', 'snake', 'frog',
-                'bee', 'ant', 'spider', 'fly', 'worm', 'whale', 'shark', 'eagle', 'owl', 'deer'
-            ],
-            
-            # Colors
-            'colors': [
-                'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink', 'brown', 'black', 'white',
-                'gray', 'grey', 'gold', 'silver', 'dark', 'light', 'bright', 'pale', 'deep', 'clear'
-            ],
-            
-            # Common actions
-            'actions': [
-                'go', 'come', 'walk', 'run', 'jump', 'sit', 'stand', 'lie', 'sleep', 'wake',
-                'eat', 'drink', 'cook', 'clean', 'wash', 'dry', 'open', 'close', 'push', 'pull',
-                'take', 'give', 'put', 'get', 'make', 'break', 'fix', 'build', 'cut', 'fold',
-                'read', 'write', 'speak', 'listen', 'look', 'see', 'watch', 'think', 'know', 'learn',
-                'teach', 'help', 'work', 'play', 'sing', 'dance', 'laugh', 'cry', 'smile', 'love'
-            ],
-            
-            # Time and weather
-            'time_weather': [
-                'day', 'night', 'morning', 'evening', 'week', 'month', 'year', 'time', 'hour', 'minute',
-                'today', 'tomorrow', 'yesterday', 'now', 'then', 'early', 'late', 'quick', 'slow', 'fast',
-                'sun', 'moon', 'star', 'sky', 'cloud', 'rain', 'snow', 'wind', 'hot', 'cold',
-                'warm', 'cool', 'wet', 'dry', 'storm', 'fog', 'ice', 'fire', 'light', 'dark'
-            ],
-            
-            # Emotions and qualities
-            'emotions': [
-                'happy', 'sad', 'angry', 'calm', 'excited', 'tired', 'strong', 'weak', 'brave', 'afraid',
-                'kind', 'mean', 'nice', 'good', 'bad', 'right', 'wrong', 'true', 'false', 'real',
-                'big', 'small', 'large', 'little', 'tall', 'short', 'long', 'wide', 'narrow', 'thick',
-                'thin', 'heavy', 'light', 'hard', 'soft', 'rough', 'smooth', 'sharp', 'dull', 'clean'
-            ],
-            
-            # Food and drink
-            'food': [
-                'bread', 'meat', 'fish', 'egg', 'milk', 'cheese', 'butter', 'sugar', 'salt', 'pepper',
-                'rice', 'pasta', 'soup', 'salad', 'fruit', 'apple', 'orange', 'banana', 'grape', 'berry',
-                'cake', 'cookie', 'tea', 'coffee', 'water', 'juice', 'wine', 'beer', 'ice', 'honey'
-            ],
-            
-            # Common adjectives
-            'adjectives': [
-                'new', 'old', 'young', 'fresh', 'clean', 'dirty', 'empty', 'full', 'open', 'closed',
-                'free', 'busy', 'easy', 'hard', 'simple', 'complex', 'clear', 'cloudy', 'quiet', 'loud',
-                'safe', 'dangerous', 'cheap', 'expensive', 'rich', 'poor', 'healthy', 'sick', 'alive', 'dead'
-            ],
-            
-            # Common verbs
-            'verbs': [
-                'be', 'have', 'do', 'say', 'get', 'make', 'know', 'think', 'take', 'see',
-                'come', 'want', 'use', 'find', 'give', 'tell', 'ask', 'work', 'seem', 'feel',
-                'try', 'leave', 'call', 'move', 'live', 'show', 'hear', 'play', 'turn', 'bring'
-            ]
-        }
+        ]]
+        
+        # Fused form so each word needs a single regex call. Every alternative
+        # is a lookahead tried at position 0 in list order, so the first
+        # matching pattern is the same one the sequential scan reported.
+        self.invalid_regex = re.compile('|'.join(
+            f'(?P<p{i}>(?=(?s:.*?)(?:{p.pattern})))' for i, p in enumerate(self.invalid_patterns)
+        ))
         
-        # Add all words from categories
-        for category, words in categories.items():
-            premium.update(words)
+        # Pronounceability checks used by _is_pronounceable
+        # Maps a word to its vowel/consonant shape, e.g. 'table' -> 'CVCCV'
+        self.cv_table = str.maketrans(
+            dict.fromkeys(VOWELS, 'V') | dict.fromkeys(CONSONANTS, 'C')
+        )
+        # All clusters are trigrams, so one pass over the word's trigrams
+        # checks every cluster at once
+        self.difficult_clusters = frozenset(['tch', 'dge', 'ght', 'ngh', 'rgh', 'sht', 'xth'])
+        self.silent_prefixes = ('gn', 'kn', 'pn', 'ps', 'pt', 'wr')
+        self.silent_suffixes = ('mb', 'mn')
         
-        return premium
+        # Premium words that would pass the exclusion and pattern checks. Their
+        # validation never changes, so it is built once and seeded into the
+        # cache, letting validate_word accept them before any other check.
+        self.accepted_premium_words = frozenset(
+            word for word in self.premium_words
+            if word not in self.excluded_words and not self.invalid_regex.match(word)
+        )
+        for word in self.accepted_premium_words:
+            self.validated_words[word] = WordValidation(
+                word=word,
+                is_real_word=True,
+                is_pronounceable=True,
+                is_memorable=True,
+                phonetic_score=1.0,
+                reason="Premium vocabulary word"
+            )
     
     def validate_word(self, word: str) -> WordValidation:
         """Comprehensive validation of a word."""
-        word = word.lower().strip()
+        return self._validate_normalized(word.lower().strip())
+    
+    def validate_words(self, words: List[str]) -> List[WordValidation]:
+        """Validate many words, scoring the ones that need it in one batch.
+        
+        Gives the same results as calling validate_word on each word, but
+        the prefilter survivors are scored together with
+        WordScorer.score_words instead of one score_word call at a time.
+        """
+        return self._validate_normalized_words([word.lower().strip() for word in words])
+    
+    def _validate_normalized(self, word: str) -> WordValidation:
+        """Validate a word without normalizing it again.
+        
+        Expects a stripped, lowercase word, as returned by
+        load_or_download_words; the generation and analysis loops call this
+        directly.
+        """
+        # Check cache
+        if word in self.validated_words:
+            return self.validated_words[word]
+        
+        validation = self._validate(word)
+        self.validated_words[word] = validation
+        return validation
+    
+    def _validate_normalized_words(self, words: List[str]) -> List[WordValidation]:
+        """Batch version of _validate_normalized for already-normalized words."""
+        pending = [word for word in dict.fromkeys(words) if word not in self.validated_words]
+        survivors = self.prefilter(pending)
+        scores = dict(zip(survivors, self.scorer.score_words(survivors).tolist()))
+        
+        for word in pending:
+            self.validated_words[word] = self._validate(word, scores.get(word))
+        
+        return [self.validated_words[word] for word in words]
+    
+    def _validate(self, word: str, phonetic_score: Optional[float] = None) -> WordValidation:
+        """Validate an already-normalized word, bypassing the cache.
+        
+        Accepted premium words are never seen here; they are pre-seeded in
+        the cache. A precomputed phonetic score, if given, is used instead
+        of scoring the word again.
+        """
+        # Cheap shape check before any set or regex lookups
+        if not (3 <= len(word) <= 10 and word.isalpha()):
+            return WordValidation(
+                word=word,
+                is_real_word=False,
+                is_pronounceable=False,
+                is_memorable=False,
+                phonetic_score=0.0,
+                reason="Not 3-10 alphabetic characters"
+            )
         
         # Check if it's in our excluded list
         if word in self.excluded_words:
@@ -199,36 +286,32 @@ class PremiumWordFilter:
             )
         
         # Check against invalid patterns
-        for pattern in self.invalid_patterns:
-            if re.search(pattern, word):
-                return WordValidation(
-                    word=word,
-                    is_real_word=False,
-                    is_pronounceable=False,
-                    is_memorable=False,
-                    phonetic_score=0.0,
-                    reason=f"Invalid pattern: {pattern}"
-                )
-        
-        # Check if it's in our premium vocabulary
-        if word in self.premium_words:
+        match = self.invalid_regex.match(word)
+        if match:
+            pattern = self.invalid_patterns[int(match.lastgroup[1:])]
             return WordValidation(
                 word=word,
-                is_real_word=True,
-                is_pronounceable=True,
-                is_memorable=True,
-                phonetic_score=1.0,
-                reason="Premium vocabulary word"
+                is_real_word=False,
+                is_pronounceable=False,
+                is_memorable=False,
+                phonetic_score=0.0,
+                reason=f"Invalid pattern: {pattern.pattern}"
             )
         
         # Check if it looks like a real English word
         is_real_word = self._looks_like_english_word(word)
         is_pronounceable = self._is_pronounceable(word)
         is_memorable = self._is_memorable(word)
-        phonetic_score = self.scorer.score_word(word).total_score
+        
+        # Only score words that passed the cheaper checks
+        passes_checks = is_real_word and is_pronounceable and is_memorable
+        if not passes_checks:
+            phonetic_score = 0.0
+        elif phonetic_score is None:
+            phonetic_score = self.scorer.score_word(word).total_score
         
         # Must pass all checks
-        if is_real_word and is_pronounceable and is_memorable and phonetic_score >= 0.8:
+        if passes_checks and phonetic_score >= 0.8:
             return WordValidation(
                 word=word,
                 is_real_word=True,
@@ -245,7 +328,7 @@ class PremiumWordFilter:
                 reasons.append("hard to pronounce")
             if not is_memorable:
                 reasons.append("not memorable")
-            if phonetic_score < 0.8:
+            if passes_checks:
                 reasons.append(f"low phonetic score ({phonetic_score:.2f})")
             
             return WordValidation(
@@ -257,6 +340,88 @@ class PremiumWordFilter:
                 reason=f"Failed checks: {', '.join(reasons)}"
             )
     
+    def prefilter(self, words: List[str]) -> List[str]:
+        """Drop normalized words that validate_word would reject early.
+        
+        Length and lowercase-letter checks run over the whole batch as array
+        operations; only the survivors go through the invalid-pattern regex
+        and then the batched structural checks. Every word removed here would
+        fail validate_word, so only the phonetic score is left to decide.
+        """
+        lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+        shaped = [words[i] for i in np.flatnonzero((lengths >= 3) & (lengths <= 10))]
+        if not shaped:
+            return []
+        
+        matrix, lengths = pack_words(shaped)
+        padding = np.arange(matrix.shape[1]) >= lengths[:, None]
+        letters = (matrix >= ord('a')) & (matrix <= ord('z'))
+        lowercase = (letters | padding).all(axis=1)
+        
+        match = self.invalid_regex.match
+        shaped = [word for word, ok in zip(shaped, lowercase.tolist()) if ok and not match(word)]
+        if not shaped:
+            return []
+        
+        # Premium words are accepted whatever the structural checks say
+        passing = self.check_words(shaped).tolist()
+        premium = self.accepted_premium_words
+        return [word for word, ok in zip(shaped, passing) if ok or word in premium]
+    
+    def check_words(self, words: List[str]) -> np.ndarray:
+        """Run the structural checks over a batch of words as array operations.
+        
+        Takes lowercase a-z words of 3-10 letters and returns True where
+        _looks_like_english_word, _is_pronounceable and _is_memorable all pass.
+        """
+        matrix, lengths = pack_words(words)
+        count, width = matrix.shape
+        rows = np.arange(count)
+        padding = np.arange(width) >= lengths[:, None]
+        vowel = np.isin(matrix, [ord(c) for c in VOWELS])
+        consonant = np.isin(matrix, [ord(c) for c in CONSONANTS])
+        
+        def codes(text: str) -> int:
+            """Pack up to three letters into one integer."""
+            return sum(ord(c) << (8 * i) for i, c in enumerate(reversed(text)))
+        
+        def run_of_three(mask: np.ndarray) -> np.ndarray:
+            return (mask[:, :-2] & mask[:, 1:-1] & mask[:, 2:]).any(axis=1)
+        
+        # _looks_like_english_word: the vowel ratio, then either a valid
+        # pattern or two separated vowels. Only single-vowel words need the
+        # pattern check.
+        vowels = vowel.sum(axis=1)
+        ratio = vowels / lengths
+        real = (vowels > 0) & (ratio >= 0.2) & (ratio <= 0.8)
+        single = np.flatnonzero(real & (vowels < 2))
+        real[single] = [self._has_valid_pattern(words[i]) for i in single]
+        
+        # _is_pronounceable
+        trigrams = (matrix[:, :-2] << 16) | (matrix[:, 1:-1] << 8) | matrix[:, 2:]
+        first_two = (matrix[:, 0] << 8) | matrix[:, 1]
+        last_two = (matrix[rows, lengths - 2] << 8) | matrix[rows, lengths - 1]
+        pronounceable = ~(
+            run_of_three(consonant)
+            | run_of_three(vowel)
+            | np.isin(trigrams, [codes(c) for c in self.difficult_clusters]).any(axis=1)
+            | np.isin(first_two, [codes(p) for p in self.silent_prefixes])
+            | np.isin(last_two, [codes(p) for p in self.silent_suffixes])
+        )
+        
+        # _is_memorable: per-word letter counts, with padding in a spare slot
+        letters = np.where(padding, 26, matrix.astype(np.int64) - ord('a'))
+        counts = np.bincount((rows[:, None] * 27 + letters).ravel(), minlength=count * 27)
+        counts = counts.reshape(count, 27)[:, :26]
+        uncommon = counts[:, [ord(c) - ord('a') for c in UNCOMMON_LETTERS]].sum(axis=1)
+        memorable = (
+            (counts.max(axis=1) <= lengths * 0.6)
+            & ((counts > 0).sum(axis=1) >= lengths * 0.5)
+            & (uncommon <= 1)
+        )
+        
+        return real & pronounceable & memorable
+    
     def _looks_like_english_word(self, word: str) -> bool:
         """Check if word looks like a real English word."""
         # Must be 3-10 characters
@@ -268,7 +433,8 @@ class PremiumWordFilter:
             return False
         
         # Check for reasonable vowel/consonant distribution
-        vowels = sum(1 for c in word if c in 'aeiou')
+        cv = word.translate(self.cv_table)
+        vowels = cv.count('V')
         consonants = len(word) - vowels
         
         # Should have at least one vowel
@@ -280,16 +446,12 @@ class PremiumWordFilter:
             return False
         
         # Check for valid English patterns
-        has_valid_pattern = False
-        for pattern in self.valid_patterns:
-            if re.search(pattern, word):
-                has_valid_pattern = True
-                break
+        has_valid_pattern = self._has_valid_pattern(word)
         
         # If no valid pattern, check for basic structure
         if not has_valid_pattern:
             # Must have alternating vowels and consonants or common structures
-            vowel_positions = [i for i, c in enumerate(word) if c in 'aeiou']
+            vowel_positions = [i for i, c in enumerate(cv) if c == 'V']
             if len(vowel_positions) >= 2:
                 # Check if vowels are reasonably spaced
                 min_spacing = min(vowel_positions[i+1] - vowel_positions[i] for i in range(len(vowel_positions)-1))
@@ -298,53 +460,82 @@ class PremiumWordFilter:
         
         return has_valid_pattern
     
+    def _has_valid_pattern(self, word: str) -> bool:
+        """Check a lowercase a-z word for a common affix or word shape."""
+        # Slicing off one letter keeps at least one letter beside the affix.
+        # Affixes are at most 4 (suffix) and 5 (prefix) letters, so the answers
+        # only depend on the last 5 and first 6 letters, which many words share.
+        tail = word[-5:]
+        has_suffix = self.suffix_matches.get(tail)
+        if has_suffix is None:
+            has_suffix = self.suffix_matches[tail] = tail[1:].endswith(self.valid_suffixes)
+        if has_suffix:
+            return True
+        
+        head = word[:6]
+        has_prefix = self.prefix_matches.get(head)
+        if has_prefix is None:
+            has_prefix = self.prefix_matches[head] = head[:-1].startswith(self.valid_prefixes)
+        
+        return has_prefix or word.translate(self.cv_table) in self.valid_shapes
+    
     def _is_pronounceable(self, word: str) -> bool:
         """Check if word is easily pronounceable."""
         # No more than 2 consonants in a row
-        if re.search(r'[bcdfghjklmnpqrstvwxz]{3,}', word):
+        cv = word.translate(self.cv_table)
+        if 'CCC' in cv:
             return False
         
         # No more than 2 vowels in a row (except common diphthongs)
-        if re.search(r'[aeiou]{3,}', word):
+        if 'VVV' in cv:
             return False
         
         # Check for difficult consonant clusters
-        difficult_clusters = ['tch', 'dge', 'ght', 'ngh', 'rgh', 'sht', 'xth']
-        for cluster in difficult_clusters:
-            if cluster in word:
-                return False
+        clusters = self.difficult_clusters
+        if any(word[i:i + 3] in clusters for i in range(len(word) - 2)):
+            return False
         
         # Check for silent letter combinations
-        silent_patterns = [r'^gn', r'^kn', r'^pn', r'^ps', r'^pt', r'^wr', r'mb$', r'mn$']
-        for pattern in silent_patterns:
-            if re.search(pattern, word):
-                return False
+        if word.startswith(self.silent_prefixes) or word.endswith(self.silent_suffixes):
+            return False
         
         return True
     
     def _is_memorable(self, word: str) -> bool:
-        """Check if word is memorable and distinct."""
+        """Check if word is memorable and distinct.
+        
+        Expects a lowercase a-z word, as left by the pattern checks.
+        """
+        # Letter counts in a fixed 26-slot array instead of a Counter and set
+        counts = bytearray(26)
+        for code in word.encode('ascii'):
+            counts[code - 97] += 1
+        
         # Not too repetitive
-        char_counts = Counter(word)
-        if max(char_counts.values()) > len(word) * 0.6:  # No character more than 60%
+        if max(counts) > len(word) * 0.6:  # No character more than 60%
             return False
         
         # Should have some variety in characters
-        if len(set(word)) < len(word) * 0.5:  # At least 50% unique characters
+        if 26 - counts.count(0) < len(word) * 0.5:  # At least 50% unique characters
             return False
         
         # Common English letter frequency patterns
-        common_letters = 'etaoinshrdlcumwfgypbvkjxqz'
-        uncommon_count = sum(1 for c in word if c in 'qxzj')
+        uncommon_count = sum(counts[ord(c) - 97] for c in UNCOMMON_LETTERS)
         if uncommon_count > 1:  # No more than one uncommon letter
             return False
         
         return True
 
 
-def generate_premium_wordlist() -> List[str]:
-    """Generate premium quality wordlist with strict validation."""
+def _validate_chunk(words: List[str]) -> List[WordValidation]:
+    """Validate a chunk of words in a worker process, keeping the real ones."""
     filter = PremiumWordFilter()
+    return [v for v in filter._validate_normalized_words(words) if v.is_real_word]
+
+
+def generate_premium_wordlist(filter: Optional[PremiumWordFilter] = None) -> List[str]:
+    """Generate premium quality wordlist with strict validation."""
+    filter = filter or PremiumWordFilter()
     
     # Load source wordlists
     print("Loading source wordlists...")
@@ -354,8 +545,7 @@ def generate_premium_wordlist() -> List[str]:
     print("Validating BIP39 words...")
     validated_words = set()
     
-    for word in bip39_words:
-        validation = filter.validate_word(word)
+    for word, validation in zip(bip39_words, filter.validate_words(bip39_words)):
         if validation.is_real_word:
             validated_words.add(word)
         else:
@@ -365,32 +555,38 @@ def generate_premium_wordlist() -> List[str]:
     
     # Process top English words with strict validation
     print("\nValidating top English words...")
-    candidates = []
-    processed = 0
+    pending = [
+        word for word in dict.fromkeys(filter.prefilter(top_english))
+        if word not in validated_words
+    ]
     
-    for word in top_english:
-        word = word.lower().strip()
-        
-        if word in validated_words:
-            continue
-        
-        validation = filter.validate_word(word)
-        if validation.is_real_word:
-            candidates.append((word, validation.phonetic_score))
-        
-        processed += 1
-        if processed % 10000 == 0:
-            print(f"Processed {processed} words, found {len(candidates)} valid candidates...")
+    # Validate chunks in worker processes; words are independent and
+    # ex.map keeps their original order
+    chunks = [pending[i:i + CHUNK_SIZE] for i in range(0, len(pending), CHUNK_SIZE)]
     
-    # Sort by quality
-    candidates.sort(key=lambda x: x[1], reverse=True)
+    # Keep only the best candidates needed in a bounded min-heap of
+    # (score, -position, word); on equal scores the later word is evicted
+    needed = max(TARGET_SIZE - len(validated_words), 0)
+    best = []
+    found = 0
+    processed = 0
+    with ProcessPoolExecutor() as executor:
+        for chunk, accepted in zip(chunks, executor.map(_validate_chunk, chunks)):
+            for validation in accepted:
+                filter.validated_words[validation.word] = validation
+                entry = (validation.phonetic_score, -found, validation.word)
+                found += 1
+                if len(best) < needed:
+                    heapq.heappush(best, entry)
+                elif needed:
+                    heapq.heappushpop(best, entry)
+            
+            processed += len(chunk)
+            print(f"Processed {processed} words, found {found} valid candidates...")
     
     # Add best candidates
     print(f"\nAdding {TARGET_SIZE - len(validated_words)} more words...")
-    for word, score in candidates:
-        if len(validated_words) >= TARGET_SIZE:
-            break
-        validated_words.add(word)
+    validated_words.update(word for _, _, word in best)
     
     # Convert to sorted list
     wordlist = sorted(list(validated_words))[:TARGET_SIZE]
@@ -399,9 +595,12 @@ def generate_premium_wordlist() -> List[str]:
     return wordlist
 
 
-def analyze_premium_quality(words: List[str]) -> Dict:
-    """Analyze the quality of the premium wordlist."""
-    filter = PremiumWordFilter()
+def analyze_premium_quality(words: List[str], filter: Optional[PremiumWordFilter] = None) -> Dict:
+    """Analyze the quality of the premium wordlist.
+    
+    Passing the filter used for generation reuses its cached validations.
+    """
+    filter = filter or PremiumWordFilter()
     
     analysis = {
         'total_words': len(words),
@@ -417,7 +616,7 @@ def analyze_premium_quality(words: List[str]) -> Dict:
     
     # Validate each word
     for word in words:
-        validation = filter.validate_word(word)
+        validation = filter._validate_normalized(word)
         category = 'excellent' if validation.phonetic_score >= 0.9 else 'good' if validation.phonetic_score >= 0.8 else 'concerning'
         
         if len(analysis['sample_words'][category]) < 20:
@@ -436,10 +635,11 @@ def main():
     print("Strict validation for real English words only")
     print("=" * 50)
     
-    wordlist = generate_premium_wordlist()
+    filter = PremiumWordFilter()
+    wordlist = generate_premium_wordlist(filter)
     
     # Analyze quality
-    analysis = analyze_premium_quality(wordlist)
+    analysis = analyze_premium_quality(wordlist, filter)
     
     print(f"\nFirst 50 words: {wordlist[:50]}")
     print(f"Length distribution: {dict(analysis['length_distribution'])}")
@@ -472,8 +672,7 @@ def main():
         "words": wordlist
     }
     
-    with open(output_dir / "premium_wordlist_65536.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
+    save_json(metadata, output_dir / "premium_wordlist_65536.json")
     
     print(f"\n✓ Saved premium wordlist to wordlists/premium_wordlist_65536.txt")
     print("✓ Saved analysis to wordlists/premium_wordlist_65536.json")
@@ -12,20 +12,369 @@ UV Dependencies:
 # dependencies = [
 #     "requests>=2.31.0",
 #     "nltk>=3.8.1",
+#     "numpy>=1.26.0",
 # ]
 # ///
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set, Dict, Tuple
+from typing import List, Set, Dict, Tuple, Optional
+import bisect
+import heapq
 import json
-import re
 from collections import Counter
+from operator import itemgetter
 
-from word_scorer import WordScorer
+import numpy as np
+
+from word_scorer import WordScorer, pack_words
+from download_sources import read_wordlist, save_json
 from generate_wordlist import load_or_download_words, save_wordlist
 
 
 TARGET_SIZE = 65536  # 2^16
+CHUNK_SIZE = 2000  # Candidates per worker task
+
+# Category lower bounds, and the category for each np.digitize bin of them
+QUALITY_THRESHOLDS = (0.6, 0.7, 0.8, 0.9)
+QUALITY_CATEGORIES = ("poor", "acceptable", "good", "very_good", "excellent")
+
+VOWELS = frozenset('aeiou')
+CONSONANTS = frozenset('bcdfghjklmnpqrstvwxyz')
+
+# str.translate tables that delete each letter class
+DROP_VOWELS = str.maketrans(dict.fromkeys(VOWELS))
+DROP_CONSONANTS = str.maketrans(dict.fromkeys(CONSONANTS))
+
+# Letter class per ASCII code point for batch classification in a single
+# table lookup; non-ASCII code points are clipped to DEL, which has no class
+VOWEL_CLASS, CONSONANT_CLASS = 1, 2
+LETTER_CLASSES = np.zeros(128, dtype=np.uint8)
+LETTER_CLASSES[[ord(c) for c in VOWELS]] = VOWEL_CLASS
+LETTER_CLASSES[[ord(c) for c in CONSONANTS]] = CONSONANT_CLASS
+
+# Specific words to exclude (obvious non-words and proper nouns), built once at import
+EXCLUDED_WORDS: frozenset[str] = frozenset({
+    # Obvious non-words
+    'aaa', 'aab', 'aac', 'aad', 'aae', 'aaf', 'aag', 'aah', 'aai', 'aaj',
+    'aak', 'aal', 'aam', 'aan', 'aao', 'aap', 'aaq', 'aar', 'aas', 'aat',
+    'aau', 'aav', 'aaw', 'aax', 'aay', 'aaz',
+    'aba', 'abb', 'abc', 'abd', 'abe', 'abf', 'abg', 'abh', 'abi', 'abj',
+    'abk', 'abl', 'abm', 'abn', 'abo', 'abp', 'abq', 'abr', 'abs', 'abt',
+    'abu', 'abv', 'abw', 'abx', 'aby', 'abz',
+    'bbb', 'ccc', 'ddd', 'eee', 'fff', 'ggg', 'hhh', 'iii', 'jjj', 'kkk',
+    'lll', 'mmm', 'nnn', 'ooo', 'ppp', 'qqq', 'rrr', 'sss', 'ttt', 'uuu',
+    'vvv', 'www', 'xxx', 'yyy', 'zzz',
+
+    # Place names and proper nouns (common ones)
+    'aalborg', 'aalto', 'aachen', 'aarhus', 'aaron', 'aaronson', 'aarp',
+    'abbott', 'abdul', 'abdullah', 'abe', 'abel', 'abelard', 'abelson',
+    'aberdeen', 'abernathy', 'abernethy', 'abidjan', 'abilene', 'abner',
+    'abraham', 'abram', 'abrams', 'abramson', 'abreu', 'abriel', 'abril',
+    'abuja', 'abyssinia', 'acadia', 'acapulco', 'accra', 'acheson',
+    'acme', 'acorn', 'acres', 'acton', 'ada', 'adair', 'adam', 'adams',
+    'addison', 'adelaide', 'aden', 'adler', 'adolf', 'adrian', 'adrienne',
+    'aegean', 'aesop', 'afghanistan', 'africa', 'agatha', 'agnes', 'ahmed',
+    'aida', 'aids', 'aiken', 'aimee', 'ajax', 'akron', 'alabama', 'alan',
+    'alaska', 'albania', 'albany', 'albert', 'alberta', 'alberto', 'albion',
+    'albuquerque', 'alcott', 'alden', 'alex', 'alexander', 'alexandra',
+    'alexandria', 'alexis', 'alfonso', 'alfred', 'algeria', 'alice', 'alicia',
+    'alison', 'allan', 'allen', 'alley', 'allison', 'alma', 'almond', 'alps',
+    'alvin', 'amanda', 'amazon', 'amber', 'amelia', 'america', 'american',
+    'ames', 'amherst', 'amigo', 'amsterdam', 'amy', 'ana', 'anaconda',
+    'anarchy', 'anastasia', 'anatole', 'anchor', 'anchorage', 'anders',
+    'anderson', 'andre', 'andrea', 'andreas', 'andrew', 'andrews', 'andy',
+    'angel', 'angela', 'angeles', 'angelo', 'angie', 'angus', 'anita',
+    'ankara', 'ann', 'anna', 'anne', 'annie', 'anthony', 'antoine',
+    'antonio', 'antwerp', 'apache', 'apollo', 'april', 'arabia', 'arabic',
+    'aramco', 'arch', 'archer', 'archie', 'arctic', 'argentina', 'aries',
+    'arizona', 'arkansas', 'arlen', 'arlene', 'arlington', 'arm', 'armand',
+    'armenia', 'armstrong', 'arnold', 'art', 'arthur', 'ascii', 'asia',
+    'aspen', 'astoria', 'athens', 'atlanta', 'atlantic', 'atlas', 'atomic',
+    'audrey', 'august', 'augusta', 'augustus', 'aurora', 'austin', 'australia',
+    'austria', 'autumn', 'avalon', 'avenue', 'avery', 'avon', 'aweekly',
+    'aztec', 'azure', 'babe', 'babel', 'babylon', 'bach', 'bacon', 'badge',
+    'baghdad', 'bahama', 'bailey', 'baker', 'baldwin', 'ball', 'baltimore',
+    'bamboo', 'banana', 'bangkok', 'bangladesh', 'bangor', 'bank', 'banks',
+    'barbara', 'barber', 'barclay', 'bare', 'barge', 'bark', 'barlow',
+    'barn', 'barnes', 'baron', 'barrett', 'barron', 'barry', 'bart',
+    'barton', 'baseball', 'basement', 'basic', 'basin', 'basis', 'basket',
+    'bass', 'bat', 'batch', 'baton', 'battle', 'baxter', 'bay', 'beach',
+    'bean', 'bear', 'beard', 'beat', 'beatrice', 'beauty', 'beck',
+    'becky', 'bed', 'bee', 'beef', 'been', 'beer', 'bell', 'belle',
+    'belly', 'belt', 'ben', 'bench', 'bend', 'benjamin', 'bennett',
+    'benny', 'bent', 'berg', 'berkeley', 'berlin', 'berry', 'bert',
+    'bertha', 'beth', 'betty', 'beverly', 'bias', 'bible', 'bicycle',
+    'bid', 'big', 'bike', 'bill', 'billy', 'bind', 'bird', 'birth',
+    'bishop', 'bit', 'black', 'blade', 'blake', 'blame', 'blank',
+    'blanket', 'blast', 'blaze', 'blend', 'bless', 'blind', 'block',
+    'bloom', 'blow', 'blue', 'board', 'boat', 'bob', 'bobby', 'body',
+    'bone', 'book', 'boom', 'boost', 'boot', 'border', 'born', 'boss',
+    'boston', 'both', 'bottle', 'bottom', 'bow', 'bowl', 'box', 'boy',
+    'boyd', 'brain', 'branch', 'brand', 'brass', 'brave', 'bread',
+    'break', 'breast', 'breath', 'breed', 'brick', 'bridge', 'brief',
+    'bright', 'bring', 'broad', 'broke', 'brook', 'brooks', 'brother',
+    'brown', 'bruce', 'brush', 'buck', 'buddy', 'budget', 'buffalo',
+    'bug', 'build', 'bulb', 'bulk', 'bull', 'bunch', 'bundle', 'burn',
+    'burst', 'bus', 'bush', 'business', 'busy', 'but', 'butter',
+    'button', 'buy', 'buzz', 'by', 'bye', 'cabin', 'cable', 'cage',
+    'cake', 'call', 'calm', 'came', 'camp', 'can', 'canal', 'candy',
+    'cap', 'cape', 'card', 'care', 'career', 'carl', 'carlo', 'carol',
+    'caroline', 'carry', 'cart', 'case', 'cash', 'cast', 'cat', 'catch',
+    'cattle', 'caught', 'cause', 'cave', 'cell', 'cent', 'center',
+    'central', 'century', 'chain', 'chair', 'chance', 'change', 'channel',
+    'chapter', 'charge', 'charlie', 'chart', 'chase', 'cheap', 'check',
+    'cheek', 'cheese', 'chef', 'cherry', 'chest', 'chicago', 'chicken',
+    'chief', 'child', 'china', 'chinese', 'choice', 'choose', 'chord',
+    'chosen', 'chris', 'christ', 'christian', 'christmas', 'church',
+    'circle', 'citizen', 'city', 'civil', 'claim', 'clan', 'clap',
+    'clark', 'class', 'classic', 'clay', 'clean', 'clear', 'clerk',
+    'click', 'client', 'cliff', 'climb', 'clip', 'clock', 'close',
+    'cloth', 'cloud', 'club', 'clue', 'cluster', 'coach', 'coal',
+    'coast', 'coat', 'code', 'coffee', 'coin', 'cold', 'cole',
+    'collect', 'college', 'colonel', 'color', 'column', 'combat',
+    'come', 'comfort', 'comic', 'command', 'comment', 'common',
+    'company', 'compare', 'complete', 'computer', 'concept', 'concern',
+    'concert', 'conduct', 'confirm', 'congress', 'connect', 'consider',
+    'consist', 'console', 'constant', 'contact', 'contain', 'content',
+    'contest', 'context', 'continue', 'contract', 'control', 'cook',
+    'cool', 'copper', 'copy', 'cord', 'core', 'corn', 'corner',
+    'correct', 'cost', 'cotton', 'could', 'council', 'count', 'country',
+    'county', 'couple', 'course', 'court', 'cousin', 'cover', 'cow',
+    'crack', 'craft', 'crash', 'crazy', 'cream', 'create', 'credit',
+    'crew', 'crime', 'crisis', 'crop', 'cross', 'crowd', 'crown',
+    'cruel', 'cruise', 'cry', 'crystal', 'cube', 'culture', 'cup',
+    'curious', 'current', 'curve', 'custom', 'cut', 'cute', 'cycle',
+    'dad', 'daily', 'damage', 'dame', 'damn', 'dance', 'danger',
+    'daniel', 'danny', 'dare', 'dark', 'data', 'date', 'daughter',
+    'dave', 'david', 'dawn', 'day', 'dead', 'deal', 'dean', 'dear',
+    'death', 'debate', 'debt', 'decade', 'december', 'decide', 'deck',
+    'declare', 'deep', 'deer', 'defeat', 'defend', 'degree', 'deliver',
+    'demand', 'democratic', 'den', 'density', 'deny', 'department',
+    'depend', 'depth', 'describe', 'desert', 'design', 'desk', 'detail',
+    'detect', 'determine', 'develop', 'device', 'devil', 'diamond',
+    'dick', 'did', 'die', 'diet', 'differ', 'digital', 'dinner',
+    'direct', 'dirt', 'dirty', 'discover', 'discuss', 'disease',
+    'disk', 'display', 'distance', 'divide', 'dizzy', 'do', 'doctor',
+    'dog', 'doll', 'dollar', 'domain', 'don', 'done', 'door', 'dot',
+    'double', 'doubt', 'douglas', 'down', 'dozen', 'draft', 'drag',
+    'drama', 'draw', 'dream', 'dress', 'drew', 'dried', 'drill',
+    'drink', 'drive', 'drop', 'drove', 'drug', 'drum', 'dry', 'duck',
+    'due', 'duke', 'dull', 'dumb', 'during', 'dust', 'duty', 'each',
+    'eager', 'ear', 'early', 'earn', 'earth', 'ease', 'east', 'easy',
+    'eat', 'echo', 'edge', 'edit', 'education', 'edward', 'effect',
+    'effort', 'egg', 'eight', 'either', 'electric', 'element', 'eleven',
+    'else', 'emily', 'emotion', 'employ', 'empty', 'end', 'enemy',
+    'energy', 'engine', 'english', 'enjoy', 'enough', 'enter', 'entire',
+    'entry', 'equal', 'equipment', 'eric', 'error', 'escape', 'essay',
+    'essential', 'establish', 'estate', 'estimate', 'ethnic', 'europe',
+    'european', 'even', 'evening', 'event', 'ever', 'every', 'everyone',
+    'everything', 'evidence', 'exact', 'example', 'except', 'exchange',
+    'excited', 'excuse', 'execute', 'executive', 'exercise', 'exist',
+    'exit', 'expect', 'expensive', 'experience', 'experiment', 'expert',
+    'explain', 'explore', 'export', 'expose', 'express', 'extend',
+    'extra', 'eye', 'face', 'fact', 'factor', 'factory', 'fail',
+    'fair', 'faith', 'fall', 'false', 'family', 'famous', 'fan',
+    'fancy', 'far', 'farm', 'fast', 'fat', 'father', 'fault',
+    'favor', 'fear', 'feature', 'federal', 'fee', 'feed', 'feel',
+    'feet', 'fell', 'fellow', 'felt', 'female', 'fence', 'few',
+    'field', 'fifteen', 'fifth', 'fifty', 'fight', 'figure', 'file',
+    'fill', 'film', 'final', 'finance', 'find', 'fine', 'finger',
+    'finish', 'fire', 'firm', 'first', 'fish', 'fit', 'five',
+    'fix', 'flag', 'flame', 'flat', 'flesh', 'flight', 'float',
+    'floor', 'flow', 'flower', 'fly', 'focus', 'folk', 'follow',
+    'food', 'foot', 'football', 'for', 'force', 'foreign', 'forest',
+    'forget', 'form', 'formal', 'former', 'fort', 'fortune', 'forty',
+    'forward', 'found', 'four', 'fourth', 'fox', 'frame', 'france',
+    'frank', 'free', 'freedom', 'french', 'fresh', 'friend', 'front',
+    'fruit', 'fuel', 'full', 'fun', 'function', 'fund', 'funny',
+    'future', 'gain', 'game', 'gang', 'gap', 'garage', 'garden',
+    'gas', 'gate', 'gather', 'gave', 'gay', 'gear', 'gene',
+    'general', 'generate', 'gentle', 'george', 'german', 'germany',
+    'get', 'gift', 'girl', 'give', 'given', 'glad', 'glass',
+    'global', 'go', 'goal', 'god', 'gold', 'golf', 'gone',
+    'good', 'government', 'grab', 'grade', 'grain', 'grand', 'grant',
+    'grass', 'grave', 'gray', 'great', 'green', 'grew', 'grid',
+    'ground', 'group', 'grow', 'growth', 'guard', 'guess', 'guest',
+    'guide', 'gun', 'guy', 'had', 'hair', 'half', 'hall',
+    'hand', 'handle', 'hang', 'happen', 'happy', 'hard', 'harry',
+    'hat', 'hate', 'have', 'he', 'head', 'health', 'hear',
+    'heard', 'heart', 'heat', 'heavy', 'held', 'hell', 'hello',
+    'help', 'henry', 'her', 'here', 'hero', 'hers', 'herself',
+    'hi', 'hide', 'high', 'hill', 'him', 'himself', 'his',
+    'history', 'hit', 'hold', 'hole', 'home', 'honest', 'honor',
+    'hope', 'horn', 'horse', 'hospital', 'host', 'hot', 'hotel',
+    'hour', 'house', 'how', 'however', 'huge', 'human', 'hundred',
+    'hung', 'hunt', 'hurt', 'husband', 'i', 'ice', 'idea',
+    'identify', 'if', 'ill', 'image', 'imagine', 'impact', 'implement',
+    'important', 'improve', 'in', 'inch', 'include', 'income',
+    'increase', 'indeed', 'independent', 'index', 'indicate', 'individual',
+    'industrial', 'industry', 'information', 'initial', 'injury',
+    'inner', 'input', 'inside', 'install', 'instance', 'instead',
+    'institution', 'instruction', 'instrument', 'insurance', 'intelligent',
+    'intend', 'interest', 'internal', 'international', 'internet',
+    'interview', 'into', 'introduce', 'investment', 'invite', 'involve',
+    'iron', 'is', 'island', 'issue', 'it', 'item', 'its',
+    'itself', 'jack', 'jackson', 'james', 'jane', 'january', 'japan',
+    'japanese', 'jazz', 'jean', 'jeff', 'jennifer', 'jerry', 'jim',
+    'job', 'joe', 'john', 'johnson', 'join', 'joint', 'joke',
+    'jones', 'joseph', 'joy', 'judge', 'july', 'jump', 'june',
+    'junior', 'jury', 'just', 'justice', 'keep', 'kelly', 'ken',
+    'kennedy', 'kept', 'key', 'keyboard', 'kick', 'kid', 'kill',
+    'kind', 'king', 'kiss', 'kitchen', 'knee', 'knew', 'knife',
+    'knock', 'know', 'knowledge', 'known', 'lab', 'labor', 'lack',
+    'lady', 'laid', 'lake', 'land', 'language', 'large', 'last',
+    'late', 'later', 'laugh', 'launch', 'law', 'lawyer', 'lay',
+    'lead', 'leader', 'league', 'lean', 'learn', 'least', 'leather',
+    'leave', 'led', 'left', 'leg', 'legal', 'length', 'less',
+    'lesson', 'let', 'letter', 'level', 'library', 'license', 'lie',
+    'life', 'lift', 'light', 'like', 'likely', 'limit', 'line',
+    'link', 'lion', 'lip', 'list', 'listen', 'little', 'live',
+    'loan', 'local', 'lock', 'log', 'long', 'look', 'lord',
+    'lose', 'loss', 'lost', 'lot', 'loud', 'love', 'low',
+    'lucky', 'lunch', 'machine', 'mad', 'made', 'magic', 'mail',
+    'main', 'maintain', 'major', 'make', 'male', 'mall', 'man',
+    'manage', 'manner', 'many', 'map', 'march', 'mark', 'market',
+    'marriage', 'married', 'marry', 'mass', 'master', 'match',
+    'material', 'math', 'matter', 'may', 'maybe', 'me', 'meal',
+    'mean', 'meaning', 'measure', 'meat', 'media', 'medical', 'meet',
+    'meeting', 'member', 'memory', 'men', 'mental', 'mention',
+    'menu', 'mess', 'message', 'metal', 'method', 'middle', 'might',
+    'mile', 'military', 'milk', 'mind', 'mine', 'minor', 'minute',
+    'mirror', 'miss', 'mission', 'mistake', 'mix', 'model', 'modern',
+    'moment', 'money', 'monitor', 'month', 'mood', 'moon', 'more',
+    'morning', 'most', 'mother', 'motor', 'mount', 'mountain', 'mouse',
+    'mouth', 'move', 'movement', 'movie', 'mr', 'mrs', 'much',
+    'multiple', 'muscle', 'music', 'must', 'my', 'myself', 'name',
+    'nation', 'national', 'native', 'natural', 'nature', 'near',
+    'nearly', 'necessary', 'neck', 'need', 'negative', 'neighbor',
+    'neither', 'nerve', 'net', 'network', 'never', 'new', 'news',
+    'newspaper', 'next', 'nice', 'night', 'nine', 'no', 'nobody',
+    'nod', 'noise', 'none', 'noon', 'nor', 'normal', 'north',
+    'nose', 'not', 'note', 'nothing', 'notice', 'now', 'number',
+    'nurse', 'object', 'observe', 'obtain', 'obvious', 'occur',
+    'ocean', 'october', 'odd', 'of', 'off', 'offer', 'office',
+    'officer', 'official', 'often', 'oh', 'oil', 'ok', 'old',
+    'on', 'once', 'one', 'only', 'onto', 'open', 'operate',
+    'operation', 'opinion', 'opportunity', 'opposite', 'option', 'or',
+    'oral', 'orange', 'order', 'ordinary', 'organ', 'organization',
+    'organize', 'origin', 'original', 'other', 'others', 'our',
+    'out', 'outcome', 'outside', 'over', 'overall', 'own', 'owner',
+    'pace', 'pack', 'package', 'page', 'pain', 'paint', 'pair',
+    'pale', 'pan', 'panel', 'paper', 'parent', 'park', 'part',
+    'particular', 'particularly', 'partner', 'party', 'pass', 'passage',
+    'past', 'pat', 'path', 'patient', 'pattern', 'paul', 'pay',
+    'payment', 'peace', 'peak', 'pen', 'people', 'per', 'percent',
+    'perfect', 'perform', 'performance', 'perhaps', 'period', 'person',
+    'personal', 'pet', 'phase', 'phone', 'photo', 'phrase', 'physical',
+    'piano', 'pick', 'picture', 'piece', 'pin', 'pink', 'pipe',
+    'pitch', 'place', 'plan', 'plane', 'plant', 'plastic', 'plate',
+    'play', 'player', 'please', 'pleasure', 'plenty', 'plot', 'plus',
+    'pm', 'pocket', 'poem', 'poet', 'poetry', 'point', 'police',
+    'policy', 'political', 'politics', 'poll', 'poor', 'pop',
+    'popular', 'population', 'port', 'position', 'positive', 'possible',
+    'post', 'pot', 'potential', 'pound', 'pour', 'poverty', 'power',
+    'powerful', 'practical', 'practice', 'pray', 'predict', 'prefer',
+    'prepare', 'present', 'president', 'press', 'pressure', 'pretty',
+    'prevent', 'previous', 'price', 'pride', 'primary', 'prime',
+    'print', 'prior', 'priority', 'prison', 'private', 'probably',
+    'problem', 'procedure', 'process', 'produce', 'product', 'production',
+    'professional', 'professor', 'program', 'project', 'promise',
+    'promote', 'proof', 'proper', 'property', 'protect', 'prove',
+    'provide', 'public', 'pull', 'purpose', 'push', 'put', 'quality',
+    'question', 'quick', 'quickly', 'quiet', 'quite', 'race',
+    'radio', 'rail', 'rain', 'raise', 'range', 'rank', 'rapid',
+    'rate', 'rather', 'rating', 'raw', 'reach', 'read', 'ready',
+    'real', 'reality', 'realize', 'really', 'reason', 'receive',
+    'recent', 'recently', 'recognize', 'recommend', 'record', 'recover',
+    'red', 'reduce', 'refer', 'reflect', 'region', 'regular',
+    'relate', 'relation', 'relationship', 'relative', 'release',
+    'relevant', 'reliable', 'religion', 'religious', 'remain', 'remember',
+    'remove', 'repeat', 'replace', 'reply', 'report', 'represent',
+    'republican', 'reputation', 'request', 'require', 'research',
+    'resource', 'respond', 'response', 'responsibility', 'rest',
+    'result', 'return', 'reveal', 'revenue', 'review', 'rich',
+    'rid', 'ride', 'right', 'ring', 'rise', 'risk', 'river',
+    'road', 'rob', 'rock', 'role', 'roll', 'room', 'root',
+    'rose', 'round', 'route', 'row', 'rule', 'run', 'running',
+    'safe', 'safety', 'said', 'sale', 'same', 'sample', 'save',
+    'say', 'scale', 'scene', 'schedule', 'scheme', 'school', 'science',
+    'scientific', 'score', 'screen', 'sea', 'search', 'season',
+    'seat', 'second', 'secret', 'section', 'sector', 'security',
+    'see', 'seed', 'seek', 'seem', 'seen', 'select', 'sell',
+    'senate', 'senator', 'send', 'senior', 'sense', 'sent', 'sentence',
+    'separate', 'september', 'series', 'serious', 'serve', 'service',
+    'session', 'set', 'setting', 'seven', 'several', 'sex',
+    'sexual', 'shake', 'shall', 'shape', 'share', 'sharp', 'she',
+    'sheet', 'shelf', 'shell', 'shelter', 'shift', 'shine', 'ship',
+    'shirt', 'shock', 'shoe', 'shoot', 'shop', 'shopping', 'shore',
+    'short', 'shot', 'should', 'shoulder', 'shout', 'show', 'shut',
+    'sick', 'side', 'sight', 'sign', 'significant', 'significantly',
+    'silence', 'silver', 'similar', 'simple', 'simply', 'since',
+    'sing', 'single', 'sink', 'sir', 'sister', 'sit', 'site',
+    'situation', 'six', 'size', 'skill', 'skin', 'sky', 'sleep',
+    'slide', 'slight', 'slightly', 'slip', 'slow', 'small', 'smart',
+    'smile', 'smoke', 'smooth', 'snap', 'snow', 'so', 'soap',
+    'social', 'society', 'soft', 'software', 'soil', 'solar',
+    'sold', 'soldier', 'solid', 'solution', 'solve', 'some',
+    'somebody', 'somehow', 'someone', 'something', 'sometimes', 'somewhat',
+    'somewhere', 'son', 'song', 'soon', 'sort', 'soul', 'sound',
+    'soup', 'source', 'south', 'southern', 'space', 'speak', 'special',
+    'specific', 'specifically', 'speech', 'speed', 'spend', 'spent',
+    'spirit', 'spoke', 'sport', 'spot', 'spread', 'spring', 'staff',
+    'stage', 'stand', 'standard', 'star', 'start', 'state', 'statement',
+    'station', 'stay', 'steal', 'step', 'stick', 'still', 'stock',
+    'stomach', 'stone', 'stood', 'stop', 'storage', 'store', 'storm',
+    'story', 'straight', 'strange', 'stranger', 'strategy', 'street',
+    'strength', 'stress', 'stretch', 'strike', 'string', 'strip',
+    'strong', 'structure', 'struggle', 'stuck', 'student', 'studio',
+    'study', 'stuff', 'stupid', 'style', 'subject', 'success',
+    'successful', 'such', 'sudden', 'suddenly', 'suffer', 'sugar',
+    'suggest', 'suit', 'summer', 'sun', 'sunday', 'super', 'supply',
+    'support', 'suppose', 'sure', 'surface', 'surgery', 'surprise',
+    'survey', 'survive', 'sweet', 'swim', 'swing', 'switch', 'system',
+    'table', 'take', 'talk', 'tall', 'tank', 'tape', 'target',
+    'task', 'taste', 'tax', 'teach', 'teacher', 'team', 'tear',
+    'technology', 'tell', 'ten', 'tend', 'term', 'test', 'text',
+    'than', 'thank', 'thanks', 'that', 'the', 'their', 'them',
+    'themselves', 'then', 'theory', 'there', 'these', 'they',
+    'thick', 'thin', 'thing', 'think', 'third', 'thirty', 'this',
+    'those', 'though', 'thought', 'thousand', 'threat', 'three',
+    'through', 'throughout', 'throw', 'thumb', 'thus', 'tie',
+    'tight', 'time', 'tiny', 'tip', 'tired', 'title', 'to',
+    'today', 'toe', 'together', 'told', 'tomato', 'tomorrow', 'tone',
+    'tongue', 'tonight', 'too', 'took', 'tool', 'tooth', 'top',
+    'topic', 'total', 'touch', 'tough', 'tour', 'toward', 'town',
+    'toy', 'track', 'trade', 'traditional', 'traffic', 'train',
+    'training', 'transfer', 'transform', 'transport', 'trap', 'travel',
+    'treat', 'treatment', 'tree', 'trial', 'tribe', 'trick',
+    'tried', 'trip', 'trouble', 'truck', 'true', 'truth', 'try',
+    'trying', 'turn', 'twelve', 'twenty', 'twice', 'twin', 'two',
+    'type', 'typical', 'ugly', 'ultimate', 'unable', 'uncle',
+    'under', 'understand', 'understanding', 'union', 'unique', 'unit',
+    'united', 'universal', 'university', 'unless', 'unlike', 'until',
+    'unusual', 'up', 'upon', 'upper', 'urban', 'urge', 'us',
+    'use', 'used', 'useful', 'user', 'usual', 'usually', 'value',
+    'van', 'various', 'vast', 'vegetable', 'vehicle', 'version',
+    'versus', 'very', 'via', 'victim', 'video', 'view', 'village',
+    'violence', 'violent', 'virtual', 'virus', 'visit', 'visual',
+    'vital', 'voice', 'volume', 'vote', 'wait', 'wake', 'walk',
+    'wall', 'want', 'war', 'warm', 'warn', 'wash', 'waste',
+    'watch', 'water', 'wave', 'way', 'we', 'weak', 'wealth',
+    'weapon', 'wear', 'weather', 'web', 'website', 'wedding', 'week',
+    'weekend', 'weekly', 'weight', 'welcome', 'well', 'west',
+    'western', 'what', 'whatever', 'wheel', 'when', 'whenever',
+    'where', 'whereas', 'wherever', 'whether', 'which', 'while',
+    'white', 'who', 'whole', 'whom', 'whose', 'why', 'wide',
+    'widely', 'wife', 'wild', 'will', 'willing', 'win', 'wind',
+    'window', 'wine', 'wing', 'winner', 'winter', 'wire', 'wise',
+    'wish', 'with', 'within', 'without', 'woman', 'women', 'won',
+    'wonder', 'wonderful', 'wood', 'wooden', 'word', 'work', 'worker',
+    'working', 'world', 'worry', 'worse', 'worst', 'worth', 'would',
+    'write', 'writer', 'writing', 'written', 'wrong', 'yard',
+    'yeah', 'year', 'yellow', 'yes', 'yesterday', 'yet', 'you',
+    'young', 'your', 'yours', 'yourself', 'youth', 'zone'
+})
 
 
 class RefinedWordFilter:
@@ -33,352 +382,85 @@ class RefinedWordFilter:
     
     def __init__(self):
         self.scorer = WordScorer()
+        self.checked_words: dict[str, bool] = {}
+        self.categorized_words: dict[str, Tuple[str, float]] = {}
         
-        # Specific problematic patterns to exclude
-        self.exclude_patterns = [
-            # Repetitive letters like aaa, bbb, etc.
-            r'^(.)\1+$',  # All same letter: aaa, bbb, etc.
-            r'^(.)\1(.)\2+$',  # Alternating pairs: abab, cdcd, etc.
-            r'^(.)\1\1',  # Three of same letter at start: aaab, bbbc, etc.
-            
-            # Non-English letter combinations
-            r'^[aeiou]{2}[bcdfghjklmnpqrstvwxz]$',  # aab, eef, oox pattern
-            r'^[bcdfghjklmnpqrstvwxz][aeiou]{2}$',  # baa, cee, doo pattern
-            r'^[aeiou][bcdfghjklmnpqrstvwxz]{2}$',  # abb, ecc, off pattern
-            
-            # Obvious abbreviations or codes
-            r'^[a-z]{2,3}$',  # Very short sequences that might be codes
-            r'^[aeiou]$',  # Single vowels
-            r'^[bcdfghjklmnpqrstvwxz]$',  # Single consonants
-        ]
-        
-        # Specific words to exclude (obvious non-words and proper nouns)
-        self.excluded_words = {
-            # Obvious non-words
-            'aaa', 'aab', 'aac', 'aad', 'aae', 'aaf', 'aag', 'aah', 'aai', 'aaj',
-            'aak', 'aal', 'aam', 'aan', 'aao', 'aap', 'aaq', 'aar', 'aas', 'aat',
-            'aau', 'aav', 'aaw', 'aax', 'aay', 'aaz',
-            'aba', 'abb', 'abc', 'abd', 'abe', 'abf', 'abg', 'abh', 'abi', 'abj',
-            'abk', 'abl', 'abm', 'abn', 'abo', 'abp', 'abq', 'abr', 'abs', 'abt',
-            'abu', 'abv', 'abw', 'abx', 'aby', 'abz',
-            'bbb', 'ccc', 'ddd', 'eee', 'fff', 'ggg', 'hhh', 'iii', 'jjj', 'kkk',
-            'lll', 'mmm', 'nnn', 'ooo', 'ppp', 'qqq', 'rrr', 'sss', 'ttt', 'uuu',
-            'vvv', 'www', 'xxx', 'yyy', 'zzz',
-            
-            # Place names and proper nouns (common ones)
-            'aalborg', 'aalto', 'aachen', 'aarhus', 'aaron', 'aaronson', 'aarp',
-            'abbott', 'abdul', 'abdullah', 'abe', 'abel', 'abelard', 'abelson',
-            'aberdeen', 'abernathy', 'abernethy', 'abidjan', 'abilene', 'abner',
-            'abraham', 'abram', 'abrams', 'abramson', 'abreu', 'abriel', 'abril',
-            'abuja', 'abyssinia', 'acadia', 'acapulco', 'accra', 'acheson',
-            'acme', 'acorn', 'acres', 'acton', 'ada', 'adair', 'adam', 'adams',
-            'addison', 'adelaide', 'aden', 'adler', 'adolf', 'adrian', 'adrienne',
-            'aegean', 'aesop', 'afghanistan', 'africa', 'agatha', 'agnes', 'ahmed',
-            'aida', 'aids', 'aiken', 'aimee', 'ajax', 'akron', 'alabama', 'alan',
-            'alaska', 'albania', 'albany', 'albert', 'alberta', 'alberto', 'albion',
-            'albuquerque', 'alcott', 'alden', 'alex', 'alexander', 'alexandra',
-            'alexandria', 'alexis', 'alfonso', 'alfred', 'algeria', 'alice', 'alicia',
-            'alison', 'allan', 'allen', 'alley', 'allison', 'alma', 'almond', 'alps',
-            'alvin', 'amanda', 'amazon', 'amber', 'amelia', 'america', 'american',
-            'ames', 'amherst', 'amigo', 'amsterdam', 'amy', 'ana', 'anaconda',
-            'anarchy', 'anastasia', 'anatole', 'anchor', 'anchorage', 'anders',
-            'anderson', 'andre', 'andrea', 'andreas', 'andrew', 'andrews', 'andy',
-            'angel', 'angela', 'angeles', 'angelo', 'angie', 'angus', 'anita',
-            'ankara', 'ann', 'anna', 'anne', 'annie', 'anthony', 'antoine',
-            'antonio', 'antwerp', 'apache', 'apollo', 'april', 'arabia', 'arabic',
-            'aramco', 'arch', 'archer', 'archie', 'arctic', 'argentina', 'aries',
-            'arizona', 'arkansas', 'arlen', 'arlene', 'arlington', 'arm', 'armand',
-            'armenia', 'armstrong', 'arnold', 'art', 'arthur', 'ascii', 'asia',
-            'aspen', 'astoria', 'athens', 'atlanta', 'atlantic', 'atlas', 'atomic',
-            'audrey', 'august', 'augusta', 'augustus', 'aurora', 'austin', 'australia',
-            'austria', 'autumn', 'avalon', 'avenue', 'avery', 'avon', 'aweekly',
-            'aztec', 'azure', 'babe', 'babel', 'babylon', 'bach', 'bacon', 'badge',
-            'baghdad', 'bahama', 'bailey', 'baker', 'baldwin', 'ball', 'baltimore',
-            'bamboo', 'banana', 'bangkok', 'bangladesh', 'bangor', 'bank', 'banks',
-            'barbara', 'barber', 'barclay', 'bare', 'barge', 'bark', 'barlow',
-            'barn', 'barnes', 'baron', 'barrett', 'barron', 'barry', 'bart',
-            'barton', 'baseball', 'basement', 'basic', 'basin', 'basis', 'basket',
-            'bass', 'bat', 'batch', 'baton', 'battle', 'baxter', 'bay', 'beach',
-            'bean', 'bear', 'beard', 'beat', 'beatrice', 'beauty', 'beck',
-            'becky', 'bed', 'bee', 'beef', 'been', 'beer', 'bell', 'belle',
-            'belly', 'belt', 'ben', 'bench', 'bend', 'benjamin', 'bennett',
-            'benny', 'bent', 'berg', 'berkeley', 'berlin', 'berry', 'bert',
-            'bertha', 'beth', 'betty', 'beverly', 'bias', 'bible', 'bicycle',
-            'bid', 'big', 'bike', 'bill', 'billy', 'bind', 'bird', 'birth',
-            'bishop', 'bit', 'black', 'blade', 'blake', 'blame', 'blank',
-            'blanket', 'blast', 'blaze', 'blend', 'bless', 'blind', 'block',
-            'bloom', 'blow', 'blue', 'board', 'boat', 'bob', 'bobby', 'body',
-            'bone', 'book', 'boom', 'boost', 'boot', 'border', 'born', 'boss',
-            'boston', 'both', 'bottle', 'bottom', 'bow', 'bowl', 'box', 'boy',
-            'boyd', 'brain', 'branch', 'brand', 'brass', 'brave', 'bread',
-            'break', 'breast', 'breath', 'breed', 'brick', 'bridge', 'brief',
-            'bright', 'bring', 'broad', 'broke', 'brook', 'brooks', 'brother',
-            'brown', 'bruce', 'brush', 'buck', 'buddy', 'budget', 'buffalo',
-            'bug', 'build', 'bulb', 'bulk', 'bull', 'bunch', 'bundle', 'burn',
-            'burst', 'bus', 'bush', 'business', 'busy', 'but', 'butter',
-            'button', 'buy', 'buzz', 'by', 'bye', 'cabin', 'cable', 'cage',
-            'cake', 'call', 'calm', 'came', 'camp', 'can', 'canal', 'candy',
-            'cap', 'cape', 'card', 'care', 'career', 'carl', 'carlo', 'carol',
-            'caroline', 'carry', 'cart', 'case', 'cash', 'cast', 'cat', 'catch',
-            'cattle', 'caught', 'cause', 'cave', 'cell', 'cent', 'center',
-            'central', 'century', 'chain', 'chair', 'chance', 'change', 'channel',
-            'chapter', 'charge', 'charlie', 'chart', 'chase', 'cheap', 'check',
-            'cheek', 'cheese', 'chef', 'cherry', 'chest', 'chicago', 'chicken',
-            'chief', 'child', 'china', 'chinese', 'choice', 'choose', 'chord',
-            'chosen', 'chris', 'christ', 'christian', 'christmas', 'church',
-            'circle', 'citizen', 'city', 'civil', 'claim', 'clan', 'clap',
-            'clark', 'class', 'classic', 'clay', 'clean', 'clear', 'clerk',
-            'click', 'client', 'cliff', 'climb', 'clip', 'clock', 'close',
-            'cloth', 'cloud', 'club', 'clue', 'cluster', 'coach', 'coal',
-            'coast', 'coat', 'code', 'coffee', 'coin', 'cold', 'cole',
-            'collect', 'college', 'colonel', 'color', 'column', 'combat',
-            'come', 'comfort', 'comic', 'command', 'comment', 'common',
-            'company', 'compare', 'complete', 'computer', 'concept', 'concern',
-            'concert', 'conduct', 'confirm', 'congress', 'connect', 'consider',
-            'consist', 'console', 'constant', 'contact', 'contain', 'content',
-            'contest', 'context', 'continue', 'contract', 'control', 'cook',
-            'cool', 'copper', 'copy', 'cord', 'core', 'corn', 'corner',
-            'correct', 'cost', 'cotton', 'could', 'council', 'count', 'country',
-            'county', 'couple', 'course', 'court', 'cousin', 'cover', 'cow',
-            'crack', 'craft', 'crash', 'crazy', 'cream', 'create', 'credit',
-            'crew', 'crime', 'crisis', 'crop', 'cross', 'crowd', 'crown',
-            'cruel', 'cruise', 'cry', 'crystal', 'cube', 'culture', 'cup',
-            'curious', 'current', 'curve', 'custom', 'cut', 'cute', 'cycle',
-            'dad', 'daily', 'damage', 'dame', 'damn', 'dance', 'danger',
-            'daniel', 'danny', 'dare', 'dark', 'data', 'date', 'daughter',
-            'dave', 'david', 'dawn', 'day', 'dead', 'deal', 'dean', 'dear',
-            'death', 'debate', 'debt', 'decade', 'december', 'decide', 'deck',
-            'declare', 'deep', 'deer', 'defeat', 'defend', 'degree', 'deliver',
-            'demand', 'democratic', 'den', 'density', 'deny', 'department',
-            'depend', 'depth', 'describe', 'desert', 'design', 'desk', 'detail',
-            'detect', 'determine', 'develop', 'device', 'devil', 'diamond',
-            'dick', 'did', 'die', 'diet', 'differ', 'digital', 'dinner',
-            'direct', 'dirt', 'dirty', 'discover', 'discuss', 'disease',
-            'disk', 'display', 'distance', 'divide', 'dizzy', 'do', 'doctor',
-            'dog', 'doll', 'dollar', 'domain', 'don', 'done', 'door', 'dot',
-            'double', 'doubt', 'douglas', 'down', 'dozen', 'draft', 'drag',
-            'drama', 'draw', 'dream', 'dress', 'drew', 'dried', 'drill',
-            'drink', 'drive', 'drop', 'drove', 'drug', 'drum', 'dry', 'duck',
-            'due', 'duke', 'dull', 'dumb', 'during', 'dust', 'duty', 'each',
-            'eager', 'ear', 'early', 'earn', 'earth', 'ease', 'east', 'easy',
-            'eat', 'echo', 'edge', 'edit', 'education', 'edward', 'effect',
-            'effort', 'egg', 'eight', 'either', 'electric', 'element', 'eleven',
-            'else', 'emily', 'emotion', 'employ', 'empty', 'end', 'enemy',
-            'energy', 'engine', 'english', 'enjoy', 'enough', 'enter', 'entire',
-            'entry', 'equal', 'equipment', 'eric', 'error', 'escape', 'essay',
-            'essential', 'establish', 'estate', 'estimate', 'ethnic', 'europe',
-            'european', 'even', 'evening', 'event', 'ever', 'every', 'everyone',
-            'everything', 'evidence', 'exact', 'example', 'except', 'exchange',
-            'excited', 'excuse', 'execute', 'executive', 'exercise', 'exist',
-            'exit', 'expect', 'expensive', 'experience', 'experiment', 'expert',
-            'explain', 'explore', 'export', 'expose', 'express', 'extend',
-            'extra', 'eye', 'face', 'fact', 'factor', 'factory', 'fail',
-            'fair', 'faith', 'fall', 'false', 'family', 'famous', 'fan',
-            'fancy', 'far', 'farm', 'fast', 'fat', 'father', 'fault',
-            'favor', 'fear', 'feature', 'federal', 'fee', 'feed', 'feel',
-            'feet', 'fell', 'fellow', 'felt', 'female', 'fence', 'few',
-            'field', 'fifteen', 'fifth', 'fifty', 'fight', 'figure', 'file',
-            'fill', 'film', 'final', 'finance', 'find', 'fine', 'finger',
-            'finish', 'fire', 'firm', 'first', 'fish', 'fit', 'five',
-            'fix', 'flag', 'flame', 'flat', 'flesh', 'flight', 'float',
-            'floor', 'flow', 'flower', 'fly', 'focus', 'folk', 'follow',
-            'food', 'foot', 'football', 'for', 'force', 'foreign', 'forest',
-            'forget', 'form', 'formal', 'former', 'fort', 'fortune', 'forty',
-            'forward', 'found', 'four', 'fourth', 'fox', 'frame', 'france',
-            'frank', 'free', 'freedom', 'french', 'fresh', 'friend', 'front',
-            'fruit', 'fuel', 'full', 'fun', 'function', 'fund', 'funny',
-            'future', 'gain', 'game', 'gang', 'gap', 'garage', 'garden',
-            'gas', 'gate', 'gather', 'gave', 'gay', 'gear', 'gene',
-            'general', 'generate', 'gentle', 'george', 'german', 'germany',
-            'get', 'gift', 'girl', 'give', 'given', 'glad', 'glass',
-            'global', 'go', 'goal', 'god', 'gold', 'golf', 'gone',
-            'good', 'government', 'grab', 'grade', 'grain', 'grand', 'grant',
-            'grass', 'grave', 'gray', 'great', 'green', 'grew', 'grid',
-            'ground', 'group', 'grow', 'growth', 'guard', 'guess', 'guest',
-            'guide', 'gun', 'guy', 'had', 'hair', 'half', 'hall',
-            'hand', 'handle', 'hang', 'happen', 'happy', 'hard', 'harry',
-            'hat', 'hate', 'have', 'he', 'head', 'health', 'hear',
-            'heard', 'heart', 'heat', 'heavy', 'held', 'hell', 'hello',
-            'help', 'henry', 'her', 'here', 'hero', 'hers', 'herself',
-            'hi', 'hide', 'high', 'hill', 'him', 'himself', 'his',
-            'history', 'hit', 'hold', 'hole', 'home', 'honest', 'honor',
-            'hope', 'horn', 'horse', 'hospital', 'host', 'hot', 'hotel',
-            'hour', 'house', 'how', 'however', 'huge', 'human', 'hundred',
-            'hung', 'hunt', 'hurt', 'husband', 'i', 'ice', 'idea',
-            'identify', 'if', 'ill', 'image', 'imagine', 'impact', 'implement',
-            'important', 'improve', 'in', 'inch', 'include', 'income',
-            'increase', 'indeed', 'independent', 'index', 'indicate', 'individual',
-            'industrial', 'industry', 'information', 'initial', 'injury',
-            'inner', 'input', 'inside', 'install', 'instance', 'instead',
-            'institution', 'instruction', 'instrument', 'insurance', 'intelligent',
-            'intend', 'interest', 'internal', 'international', 'internet',
-            'interview', 'into', 'introduce', 'investment', 'invite', 'involve',
-            'iron', 'is', 'island', 'issue', 'it', 'item', 'its',
-            'itself', 'jack', 'jackson', 'james', 'jane', 'january', 'japan',
-            'japanese', 'jazz', 'jean', 'jeff', 'jennifer', 'jerry', 'jim',
-            'job', 'joe', 'john', 'johnson', 'join', 'joint', 'joke',
-            'jones', 'joseph', 'joy', 'judge', 'july', 'jump', 'june',
-            'junior', 'jury', 'just', 'justice', 'keep', 'kelly', 'ken',
-            'kennedy', 'kept', 'key', 'keyboard', 'kick', 'kid', 'kill',
-            'kind', 'king', 'kiss', 'kitchen', 'knee', 'knew', 'knife',
-            'knock', 'know', 'knowledge', 'known', 'lab', 'labor', 'lack',
-            'lady', 'laid', 'lake', 'land', 'language', 'large', 'last',
-            'late', 'later', 'laugh', 'launch', 'law', 'lawyer', 'lay',
-            'lead', 'leader', 'league', 'lean', 'learn', 'least', 'leather',
-            'leave', 'led', 'left', 'leg', 'legal', 'length', 'less',
-            'lesson', 'let', 'letter', 'level', 'library', 'license', 'lie',
-            'life', 'lift', 'light', 'like', 'likely', 'limit', 'line',
-            'link', 'lion', 'lip', 'list', 'listen', 'little', 'live',
-            'loan', 'local', 'lock', 'log', 'long', 'look', 'lord',
-            'lose', 'loss', 'lost', 'lot', 'loud', 'love', 'low',
-            'lucky', 'lunch', 'machine', 'mad', 'made', 'magic', 'mail',
-            'main', 'maintain', 'major', 'make', 'male', 'mall', 'man',
-            'manage', 'manner', 'many', 'map', 'march', 'mark', 'market',
-            'marriage', 'married', 'marry', 'mass', 'master', 'match',
-            'material', 'math', 'matter', 'may', 'maybe', 'me', 'meal',
-            'mean', 'meaning', 'measure', 'meat', 'media', 'medical', 'meet',
-            'meeting', 'member', 'memory', 'men', 'mental', 'mention',
-            'menu', 'mess', 'message', 'metal', 'method', 'middle', 'might',
-            'mile', 'military', 'milk', 'mind', 'mine', 'minor', 'minute',
-            'mirror', 'miss', 'mission', 'mistake', 'mix', 'model', 'modern',
-            'moment', 'money', 'monitor', 'month', 'mood', 'moon', 'more',
-            'morning', 'most', 'mother', 'motor', 'mount', 'mountain', 'mouse',
-            'mouth', 'move', 'movement', 'movie', 'mr', 'mrs', 'much',
-            'multiple', 'muscle', 'music', 'must', 'my', 'myself', 'name',
-            'nation', 'national', 'native', 'natural', 'nature', 'near',
-            'nearly', 'necessary', 'neck', 'need', 'negative', 'neighbor',
-            'neither', 'nerve', 'net', 'network', 'never', 'new', 'news',
-            'newspaper', 'next', 'nice', 'night', 'nine', 'no', 'nobody',
-            'nod', 'noise', 'none', 'noon', 'nor', 'normal', 'north',
-            'nose', 'not', 'note', 'nothing', 'notice', 'now', 'number',
-            'nurse', 'object', 'observe', 'obtain', 'obvious', 'occur',
-            'ocean', 'october', 'odd', 'of', 'off', 'offer', 'office',
-            'officer', 'official', 'often', 'oh', 'oil', 'ok', 'old',
-            'on', 'once', 'one', 'only', 'onto', 'open', 'operate',
-            'operation', 'opinion', 'opportunity', 'opposite', 'option', 'or',
-            'oral', 'orange', 'order', 'ordinary', 'organ', 'organization',
-            'organize', 'origin', 'original', 'other', 'others', 'our',
-            'out', 'outcome', 'outside', 'over', 'overall', 'own', 'owner',
-            'pace', 'pack', 'package', 'page', 'pain', 'paint', 'pair',
-            'pale', 'pan', 'panel', 'paper', 'parent', 'park', 'part',
-            'particular', 'particularly', 'partner', 'party', 'pass', 'passage',
-            'past', 'pat', 'path', 'patient', 'pattern', 'paul', 'pay',
-            'payment', 'peace', 'peak', 'pen', 'people', 'per', 'percent',
-            'perfect', 'perform', 'performance', 'perhaps', 'period', 'person',
-            'personal', 'pet', 'phase', 'phone', 'photo', 'phrase', 'physical',
-            'piano', 'pick', 'picture', 'piece', 'pin', 'pink', 'pipe',
-            'pitch', 'place', 'plan', 'plane', 'plant', 'plastic', 'plate',
-            'play', 'player', 'please', 'pleasure', 'plenty', 'plot', 'plus',
-            'pm', 'pocket', 'poem', 'poet', 'poetry', 'point', 'police',
-            'policy', 'political', 'politics', 'poll', 'poor', 'pop',
-            'popular', 'population', 'port', 'position', 'positive', 'possible',
-            'post', 'pot', 'potential', 'pound', 'pour', 'poverty', 'power',
-            'powerful', 'practical', 'practice', 'pray', 'predict', 'prefer',
-            'prepare', 'present', 'president', 'press', 'pressure', 'pretty',
-            'prevent', 'previous', 'price', 'pride', 'primary', 'prime',
-            'print', 'prior', 'priority', 'prison', 'private', 'probably',
-            'problem', 'procedure', 'process', 'produce', 'product', 'production',
-            'professional', 'professor', 'program', 'project', 'promise',
-            'promote', 'proof', 'proper', 'property', 'protect', 'prove',
-            'provide', 'public', 'pull', 'purpose', 'push', 'put', 'quality',
-            'question', 'quick', 'quickly', 'quiet', 'quite', 'race',
-            'radio', 'rail', 'rain', 'raise', 'range', 'rank', 'rapid',
-            'rate', 'rather', 'rating', 'raw', 'reach', 'read', 'ready',
-            'real', 'reality', 'realize', 'really', 'reason', 'receive',
-            'recent', 'recently', 'recognize', 'recommend', 'record', 'recover',
-            'red', 'reduce', 'refer', 'reflect', 'region', 'regular',
-            'relate', 'relation', 'relationship', 'relative', 'release',
-            'relevant', 'reliable', 'religion', 'religious', 'remain', 'remember',
-            'remove', 'repeat', 'replace', 'reply', 'report', 'represent',
-            'republican', 'reputation', 'request', 'require', 'research',
-            'resource', 'respond', 'response', 'responsibility', 'rest',
-            'result', 'return', 'reveal', 'revenue', 'review', 'rich',
-            'rid', 'ride', 'right', 'ring', 'rise', 'risk', 'river',
-            'road', 'rob', 'rock', 'role', 'roll', 'room', 'root',
-            'rose', 'round', 'route', 'row', 'rule', 'run', 'running',
-            'safe', 'safety', 'said', 'sale', 'same', 'sample', 'save',
-            'say', 'scale', 'scene', 'schedule', 'scheme', 'school', 'science',
-            'scientific', 'score', 'screen', 'sea', 'search', 'season',
-            'seat', 'second', 'secret', 'section', 'sector', 'security',
-            'see', 'seed', 'seek', 'seem', 'seen', 'select', 'sell',
-            'senate', 'senator', 'send', 'senior', 'sense', 'sent', 'sentence',
-            'separate', 'september', 'series', 'serious', 'serve', 'service',
-            'session', 'set', 'setting', 'seven', 'several', 'sex',
-            'sexual', 'shake', 'shall', 'shape', 'share', 'sharp', 'she',
-            'sheet', 'shelf', 'shell', 'shelter', 'shift', 'shine', 'ship',
-            'shirt', 'shock', 'shoe', 'shoot', 'shop', 'shopping', 'shore',
-            'short', 'shot', 'should', 'shoulder', 'shout', 'show', 'shut',
-            'sick', 'side', 'sight', 'sign', 'significant', 'significantly',
-            'silence', 'silver', 'similar', 'simple', 'simply', 'since',
-            'sing', 'single', 'sink', 'sir', 'sister', 'sit', 'site',
-            'situation', 'six', 'size', 'skill', 'skin', 'sky', 'sleep',
-            'slide', 'slight', 'slightly', 'slip', 'slow', 'small', 'smart',
-            'smile', 'smoke', 'smooth', 'snap', 'snow', 'so', 'soap',
-            'social', 'society', 'soft', 'software', 'soil', 'solar',
-            'sold', 'soldier', 'solid', 'solution', 'solve', 'some',
-            'somebody', 'somehow', 'someone', 'something', 'sometimes', 'somewhat',
-            'somewhere', 'son', 'song', 'soon', 'sort', 'soul', 'sound',
-            'soup', 'source', 'south', 'southern', 'space', 'speak', 'special',
-            'specific', 'specifically', 'speech', 'speed', 'spend', 'spent',
-            'spirit', 'spoke', 'sport', 'spot', 'spread', 'spring', 'staff',
-            'stage', 'stand', 'standard', 'star', 'start', 'state', 'statement',
-            'station', 'stay', 'steal', 'step', 'stick', 'still', 'stock',
-            'stomach', 'stone', 'stood', 'stop', 'storage', 'store', 'storm',
-            'story', 'straight', 'strange', 'stranger', 'strategy', 'street',
-            'strength', 'stress', 'stretch', 'strike', 'string', 'strip',
-            'strong', 'structure', 'struggle', 'stuck', 'student', 'studio',
-            'study', 'stuff', 'stupid', 'style', 'subject', 'success',
-            'successful', 'such', 'sudden', 'suddenly', 'suffer', 'sugar',
-            'suggest', 'suit', 'summer', 'sun', 'sunday', 'super', 'supply',
-            'support', 'suppose', 'sure', 'surface', 'surgery', 'surprise',
-            'survey', 'survive', 'sweet', 'swim', 'swing', 'switch', 'system',
-            'table', 'take', 'talk', 'tall', 'tank', 'tape', 'target',
-            'task', 'taste', 'tax', 'teach', 'teacher', 'team', 'tear',
-            'technology', 'tell', 'ten', 'tend', 'term', 'test', 'text',
-            'than', 'thank', 'thanks', 'that', 'the', 'their', 'them',
-            'themselves', 'then', 'theory', 'there', 'these', 'they',
-            'thick', 'thin', 'thing', 'think', 'third', 'thirty', 'this',
-            'those', 'though', 'thought', 'thousand', 'threat', 'three',
-            'through', 'throughout', 'throw', 'thumb', 'thus', 'tie',
-            'tight', 'time', 'tiny', 'tip', 'tired', 'title', 'to',
-            'today', 'toe', 'together', 'told', 'tomato', 'tomorrow', 'tone',
-            'tongue', 'tonight', 'too', 'took', 'tool', 'tooth', 'top',
-            'topic', 'total', 'touch', 'tough', 'tour', 'toward', 'town',
-            'toy', 'track', 'trade', 'traditional', 'traffic', 'train',
-            'training', 'transfer', 'transform', 'transport', 'trap', 'travel',
-            'treat', 'treatment', 'tree', 'trial', 'tribe', 'trick',
-            'tried', 'trip', 'trouble', 'truck', 'true', 'truth', 'try',
-            'trying', 'turn', 'twelve', 'twenty', 'twice', 'twin', 'two',
-            'type', 'typical', 'ugly', 'ultimate', 'unable', 'uncle',
-            'under', 'understand', 'understanding', 'union', 'unique', 'unit',
-            'united', 'universal', 'university', 'unless', 'unlike', 'until',
-            'unusual', 'up', 'upon', 'upper', 'urban', 'urge', 'us',
-            'use', 'used', 'useful', 'user', 'usual', 'usually', 'value',
-            'van', 'various', 'vast', 'vegetable', 'vehicle', 'version',
-            'versus', 'very', 'via', 'victim', 'video', 'view', 'village',
-            'violence', 'violent', 'virtual', 'virus', 'visit', 'visual',
-            'vital', 'voice', 'volume', 'vote', 'wait', 'wake', 'walk',
-            'wall', 'want', 'war', 'warm', 'warn', 'wash', 'waste',
-            'watch', 'water', 'wave', 'way', 'we', 'weak', 'wealth',
-            'weapon', 'wear', 'weather', 'web', 'website', 'wedding', 'week',
-            'weekend', 'weekly', 'weight', 'welcome', 'well', 'west',
-            'western', 'what', 'whatever', 'wheel', 'when', 'whenever',
-            'where', 'whereas', 'wherever', 'whether', 'which', 'while',
-            'white', 'who', 'whole', 'whom', 'whose', 'why', 'wide',
-            'widely', 'wife', 'wild', 'will', 'willing', 'win', 'wind',
-            'window', 'wine', 'wing', 'winner', 'winter', 'wire', 'wise',
-            'wish', 'with', 'within', 'without', 'woman', 'women', 'won',
-            'wonder', 'wonderful', 'wood', 'wooden', 'word', 'work', 'worker',
-            'working', 'world', 'worry', 'worse', 'worst', 'worth', 'would',
-            'write', 'writer', 'writing', 'written', 'wrong', 'yard',
-            'yeah', 'year', 'yellow', 'yes', 'yesterday', 'yet', 'you',
-            'young', 'your', 'yours', 'yourself', 'youth', 'zone'
-        }
+        # Shared module-level set, built once at import
+        self.excluded_words = EXCLUDED_WORDS
     
     def is_valid_word(self, word: str) -> bool:
         """Check if word is valid using refined criteria."""
-        word = word.lower().strip()
+        return self._is_valid_normalized(word.lower().strip())
+    
+    def _is_valid_normalized(self, word: str) -> bool:
+        """Check a word without normalizing it again.
+        
+        Expects a stripped, lowercase word, as returned by
+        load_or_download_words; generation calls this directly.
+        """
+        # Check cache
+        if word in self.checked_words:
+            return self.checked_words[word]
+        
+        # Use basic word scorer for final validation
+        is_valid = (
+            self._passes_checks(word)
+            and self.scorer.score_word(word).total_score >= 0.6  # Lower threshold to keep more real words
+        )
+        self.checked_words[word] = is_valid
+        return is_valid
+    
+    def prefilter(self, words: List[str]) -> List[str]:
+        """Keep the normalized words that _passes_checks accepts.
         
+        For a-z words every structural check (length, short codes, repeated
+        letters and pairs, vowel ratio) runs over the whole batch as array
+        operations in one sweep. The few words with other characters go
+        through _passes_checks one at a time.
+        """
+        lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+        shaped = [words[i] for i in np.flatnonzero((lengths >= 3) & (lengths <= 10))]
+        if not shaped:
+            return []
+        
+        matrix, lengths = pack_words(shaped)
+        padding = np.arange(matrix.shape[1]) >= lengths[:, None]
+        classes = LETTER_CLASSES[np.minimum(matrix, 127)]
+        vowel = classes == VOWEL_CLASS
+        consonant = classes == CONSONANT_CLASS
+        letters_only = (vowel | consonant | padding).all(axis=1)
+        
+        vowels = vowel.sum(axis=1)
+        consonants = consonant.sum(axis=1)
+        vowel_ratio = vowels / lengths
+        repeated_start = (matrix[:, 0] == matrix[:, 1]) & (matrix[:, 1] == matrix[:, 2])
+        doubled_pairs = (
+            (lengths >= 4)
+            & (matrix[:, 0] == matrix[:, 1])
+            & ((matrix[:, 2:] == matrix[:, 2:3]) | padding[:, 2:]).all(axis=1)
+        )
+        passes = (
+            (lengths > 3)
+            & ~repeated_start
+            & ~doubled_pairs
+            & (vowels > 0)
+            & (consonants > 0)
+            & (vowel_ratio >= 0.15)
+            & (vowel_ratio <= 0.75)
+        )
+        
+        keep = (letters_only & passes).tolist()
+        for i in np.flatnonzero(~letters_only).tolist():
+            keep[i] = self._passes_checks(shaped[i])
+        
+        excluded = self.excluded_words
+        return [word for word, ok in zip(shaped, keep) if ok and word not in excluded]
+    
+    def _passes_checks(self, word: str) -> bool:
+        """Run every check except scoring on an already-normalized word.
+        
+        Checks run cheapest first so most rejections stay cheap.
+        """
         # Basic length check
         if len(word) < 3 or len(word) > 10:
             return False
@@ -391,48 +473,97 @@ class RefinedWordFilter:
         if word in self.excluded_words:
             return False
         
-        # Check problematic patterns
-        for pattern in self.exclude_patterns:
-            if re.search(pattern, word):
-                return False
+        # Very short sequences that might be codes
+        if len(word) == 3 and word.isascii():
+            return False
         
-        # Must have at least one vowel
-        if not any(c in 'aeiou' for c in word):
+        # Three of the same letter at the start (aaab), which also covers
+        # words made of a single repeated letter (aaa, bbbb)
+        if word[0] == word[1] == word[2]:
             return False
         
-        # Must have at least one consonant
-        if not any(c in 'bcdfghjklmnpqrstvwxyz' for c in word):
+        # Count vowels and consonants by deleting them in C
+        without_vowels = word.translate(DROP_VOWELS)
+        vowels = len(word) - len(without_vowels)
+        consonants = len(without_vowels) - len(without_vowels.translate(DROP_CONSONANTS))
+        
+        # Must have at least one vowel and one consonant
+        if not vowels or not consonants:
             return False
         
         # Check for reasonable vowel/consonant ratio
-        vowels = sum(1 for c in word if c in 'aeiou')
         vowel_ratio = vowels / len(word)
         if vowel_ratio < 0.15 or vowel_ratio > 0.75:  # 15% to 75% vowels
             return False
         
-        # Use basic word scorer for final validation
-        score = self.scorer.score_word(word)
-        return score.total_score >= 0.6  # Lower threshold to keep more real words
+        # Repetitive letters like aabb or ccddd: a doubled letter followed by
+        # one letter repeated to the end
+        if len(word) >= 4 and word[0] == word[1] and word.count(word[2], 2) == len(word) - 2:
+            return False
+        
+        return True
+    
+    def categorize_words(self, words: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+        """Check and categorize many normalized words, scoring them in one batch.
+        
+        Returns valid words grouped by category from best to worst, each
+        list in input order. Words that fail a check or score below 0.6 are
+        left out, as is_valid_word would reject them.
+        """
+        passing = [word for word in words if self._passes_checks(word)]
+        scores = self.scorer.score_words(passing)
+        tiers = np.digitize(scores, QUALITY_THRESHOLDS)
+        
+        categorized = {category: [] for category in reversed(QUALITY_CATEGORIES[1:])}
+        for word, score, tier in zip(passing, scores.tolist(), tiers.tolist()):
+            if tier:
+                categorized[QUALITY_CATEGORIES[tier]].append((word, score))
+        return categorized
+    
+    def categorize_all(self, words: List[str]) -> List[Tuple[str, float]]:
+        """Categorize many words, scoring the uncached ones in one batch.
+        
+        Returns (category, score) per word in input order, the same as
+        categorize_word, and caches every result.
+        """
+        cache = self.categorized_words
+        missing = [word for word in dict.fromkeys(words) if word not in cache]
+        if missing:
+            scores = self.scorer.score_words(missing)
+            tiers = np.digitize(scores, QUALITY_THRESHOLDS)
+            for word, score, tier in zip(missing, scores.tolist(), tiers.tolist()):
+                cache[word] = (QUALITY_CATEGORIES[tier], score)
+        return [cache[word] for word in words]
     
     def categorize_word(self, word: str) -> Tuple[str, float]:
-        """Categorize word by quality."""
-        score = self.scorer.score_word(word)
+        """Categorize word by quality.
         
-        if score.total_score >= 0.9:
-            return "excellent", score.total_score
-        elif score.total_score >= 0.8:
-            return "very_good", score.total_score
-        elif score.total_score >= 0.7:
-            return "good", score.total_score
-        elif score.total_score >= 0.6:
-            return "acceptable", score.total_score
-        else:
-            return "poor", score.total_score
+        Results are cached per word. Scores come from the scorer's own cache,
+        so categorizing a word that is_valid_word already checked does not
+        score it again.
+        """
+        if word in self.categorized_words:
+            return self.categorized_words[word]
+        
+        score = self.scorer.score_word(word).total_score
+        result = (self._categorize_score(score), score)
+        self.categorized_words[word] = result
+        return result
+    
+    def _categorize_score(self, score: float) -> str:
+        """Quality category for a total score."""
+        return QUALITY_CATEGORIES[bisect.bisect_right(QUALITY_THRESHOLDS, score)]
 
 
-def generate_refined_wordlist() -> List[str]:
-    """Generate refined wordlist with better quality control."""
+def _categorize_chunk(words: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+    """Check and categorize a chunk of words in a worker process."""
     filter = RefinedWordFilter()
+    return filter.categorize_words(words)
+
+
+def generate_refined_wordlist(filter: Optional[RefinedWordFilter] = None) -> List[str]:
+    """Generate refined wordlist with better quality control."""
+    filter = filter or RefinedWordFilter()
     
     # Load source wordlists
     print("Loading source wordlists...")
@@ -444,7 +575,7 @@ def generate_refined_wordlist() -> List[str]:
     excluded_bip39 = []
     
     for word in bip39_words:
-        if filter.is_valid_word(word):
+        if filter._is_valid_normalized(word):
             final_words.add(word)
         else:
             excluded_bip39.append(word)
@@ -455,90 +586,102 @@ def generate_refined_wordlist() -> List[str]:
     
     # Process top English words
     print("\nProcessing top English words...")
-    categorized = {
-        "excellent": [],
-        "very_good": [],
-        "good": [],
-        "acceptable": []
-    }
+    # Deduplicate in order, then drop the few BIP39 words already kept
+    # rather than probing final_words once per candidate
+    unique = dict.fromkeys(filter.prefilter(top_english))
+    for word in final_words:
+        unique.pop(word, None)
+    candidates = list(unique)
     
-    processed = 0
-    for word in top_english:
-        word = word.lower().strip()
-        
-        if word in final_words:
-            continue
-        
-        if filter.is_valid_word(word):
-            category, score = filter.categorize_word(word)
-            if category != "poor":
-                categorized[category].append((word, score))
-        
-        processed += 1
-        if processed % 10000 == 0:
-            print(f"Processed {processed} words...")
+    # Score chunks in worker processes; merging them in order keeps each
+    # category in candidate order
+    chunks = [candidates[i:i + CHUNK_SIZE] for i in range(0, len(candidates), CHUNK_SIZE)]
+    categorized = {category: [] for category in reversed(QUALITY_CATEGORIES[1:])}
+    with ProcessPoolExecutor() as executor:
+        for chunk_categorized in executor.map(_categorize_chunk, chunks):
+            for category, entries in chunk_categorized.items():
+                categorized[category].extend(entries)
+    print(f"Processed {len(candidates)} words...")
     
-    # Sort each category by score
-    for category in categorized:
-        categorized[category].sort(key=lambda x: x[1], reverse=True)
-    
-    # Add words by quality
+    # Add words by quality, taking only the best words still needed from
+    # each category rather than sorting it in full
     print("\nAdding words by quality category...")
     for category in ["excellent", "very_good", "good", "acceptable"]:
-        added = 0
-        for word, score in categorized[category]:
-            if len(final_words) >= TARGET_SIZE:
-                break
-            final_words.add(word)
-            added += 1
+        needed = TARGET_SIZE - len(final_words)
+        best = heapq.nlargest(needed, categorized[category], key=itemgetter(1))
+        final_words.update(word for word, score in best)
+        filter.categorized_words.update(
+            (word, (category, score)) for word, score in best
+        )
         
-        print(f"Added {added} {category} words (total: {len(final_words)})")
+        print(f"Added {len(best)} {category} words (total: {len(final_words)})")
         
         if len(final_words) >= TARGET_SIZE:
             break
     
     # Convert to sorted list
-    wordlist = sorted(list(final_words))[:TARGET_SIZE]
+    wordlist = sorted(final_words)
     
     return wordlist
 
 
-def analyze_refined_quality(words: List[str]) -> Dict:
-    """Analyze the quality of the refined wordlist."""
-    filter = RefinedWordFilter()
+def analyze_refined_quality(words: List[str], filter: Optional[RefinedWordFilter] = None) -> Dict:
+    """Analyze the quality of the refined wordlist.
     
-    # Quality distribution
-    quality_dist = Counter()
-    for word in words:
-        category, _ = filter.categorize_word(word)
-        quality_dist[category] += 1
+    Passing the filter used for generation reuses the categories it already
+    worked out in its worker processes.
+    """
+    filter = filter or RefinedWordFilter()
     
-    # Sample words from each quality tier
+    # Categorize the whole list in one batch, then count and sample it
+    categorized = filter.categorize_all(words)
+    quality_dist = Counter(category for category, _ in categorized)
+    
+    # Sample words from each quality tier, stopping once every tier is full
     samples = {"excellent": [], "very_good": [], "good": [], "acceptable": []}
-    for word in words:
-        category, score = filter.categorize_word(word)
-        if len(samples[category]) < 10:
-            samples[category].append((word, score))
+    full_tiers = 0
+    for word, (category, score) in zip(words, categorized):
+        tier_samples = samples[category]
+        if len(tier_samples) < 10:
+            tier_samples.append((word, score))
+            if len(tier_samples) == 10:
+                full_tiers += 1
+                if full_tiers == len(samples):
+                    break
+    
+    # Length distribution, counted in one bincount and keyed by length
+    lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+    length_dist = {
+        length: count
+        for length, count in enumerate(np.bincount(lengths).tolist()) if count
+    }
     
     return {
         "quality_distribution": dict(quality_dist),
-        "length_distribution": dict(Counter(len(word) for word in words)),
+        "length_distribution": length_dist,
         "sample_words": samples
     }
 
 
+def load_refined_wordlist(metadata_path: Path) -> List[str]:
+    """Load the words for a refined metadata file from its sibling text file."""
+    metadata = json.loads(metadata_path.read_text())
+    return read_wordlist(metadata_path.parent / metadata["wordlist_file"])
+
+
 def main():
     """Generate refined wordlist."""
     print("Refined Wordlist Generator")
     print("Eliminating non-words while keeping real English words")
     print("=" * 60)
     
-    wordlist = generate_refined_wordlist()
+    filter = RefinedWordFilter()
+    wordlist = generate_refined_wordlist(filter)
     
     print(f"\nGenerated {len(wordlist)} words")
     
     # Analyze quality
-    analysis = analyze_refined_quality(wordlist)
+    analysis = analyze_refined_quality(wordlist, filter)
     
     print("\nQuality Distribution:")
     for category, count in analysis["quality_distribution"].items():
@@ -563,7 +706,8 @@ def main():
     # Save wordlist
     save_wordlist(wordlist, "../wordlists/refined_wordlist_65536.txt")
     
-    # Save with analysis
+    # Save with analysis; compact, since the file is only read by tools. The
+    # words themselves are only in the text file, which the metadata names
     metadata = {
         "version": "4.0",
         "word_count": len(wordlist),
@@ -571,11 +715,10 @@ def main():
         "includes_bip39": True,
         "quality_analysis": analysis,
         "description": "Refined wordlist eliminating non-words while preserving real English words",
-        "words": wordlist
+        "wordlist_file": "refined_wordlist_65536.txt"
     }
     
-    with open(output_dir / "refined_wordlist_65536.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
+    save_json(metadata, output_dir / "refined_wordlist_65536.json", compact=True)
     
     print(f"\n✓ Saved refined wordlist to wordlists/refined_wordlist_65536.txt")
     print("✓ Saved analysis to wordlists/refined_wordlist_65536.json")
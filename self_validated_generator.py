@@ -20,11 +20,75 @@ import time
 from pathlib import Path
 from typing import List, Set, Dict, Optional, Tuple
 from dataclasses import dataclass
-import re
 
+from download_sources import read_wordlist
 from generate_wordlist import load_or_download_words
 
 
+VOWELS = frozenset('aeiou')
+CONSONANTS = frozenset('bcdfghjklmnpqrstvwxyz')
+
+# Words allowed to contain a tripled letter
+TRIPLE_LETTER_WORDS = frozenset({'committee', 'balloon', 'success'})
+
+ARCHAIC_WORDS = frozenset({
+    'thou', 'thee', 'thy', 'thine', 'hath', 'hast', 'doth', 'dost',
+    'shalt', 'wilt', 'art', 'unto', 'ye', 'yea', 'nay', 'wherefore',
+    'whence', 'whither', 'thence', 'thither', 'hither', 'betwixt'
+})
+
+OFFENSIVE_WORDS = frozenset({
+    'damn', 'hell', 'bastard', 'bitch', 'shit', 'fuck', 'ass', 'piss',
+    'crap', 'dick', 'cock', 'pussy', 'tit', 'whore', 'slut', 'fag',
+    'nigger', 'kike', 'spic', 'chink', 'gook', 'wop', 'kraut'
+})
+
+
+def _letter_pattern_issue(word: str) -> str:
+    """Find the first unusual letter pattern in a word of 3+ letters.
+    
+    Runs the vowel-run, consonant-run, starting-pattern, triple-letter and
+    vowel/consonant presence checks in one scan, returning the rejection
+    reason for the first check that fails in that order, or "" if none do.
+    """
+    vowel_run = consonant_run = 0
+    has_vowel = has_consonant = long_consonant_run = triple = False
+    previous = before_previous = ''
+    
+    for char in word:
+        if char in VOWELS:
+            vowel_run += 1
+            consonant_run = 0
+            has_vowel = True
+            # Nothing is checked before this, so stop scanning at once
+            if vowel_run >= 4:
+                return "too many consecutive vowels"
+        elif char in CONSONANTS:
+            consonant_run += 1
+            vowel_run = 0
+            has_consonant = True
+            if consonant_run >= 5:
+                long_consonant_run = True
+        else:
+            vowel_run = consonant_run = 0
+        
+        if char == previous == before_previous:
+            triple = True
+        before_previous, previous = previous, char
+    
+    if long_consonant_run:
+        return "too many consecutive consonants"
+    if word[0] in 'xz' and word[1] not in VOWELS:
+        return "unusual starting pattern"
+    if triple and word not in TRIPLE_LETTER_WORDS:
+        return "triple letter pattern"
+    if not has_vowel:
+        return "no vowels"
+    if not has_consonant:
+        return "no consonants"
+    return ""
+
+
 @dataclass
 class ValidationState:
     """Track validation progress."""
@@ -33,6 +97,7 @@ class ValidationState:
     remaining_candidates: List[str]
     batches_processed: int
     start_time: float
+    total_candidates: int
 
 
 class SelfValidatedGenerator:
@@ -45,14 +110,32 @@ class SelfValidatedGenerator:
         self.output_dir = Path("wordlists")
         self.output_dir.mkdir(exist_ok=True)
         
+        # Resumable state: small JSON counters plus word files that grow
+        # by one batch at a time instead of being rewritten in full
         self.state_file = self.output_dir / "self_validation_state.json"
-        self.log_file = self.output_dir / "self_validation_log.json"
+        self.candidates_file = self.output_dir / "self_validation_candidates.txt"
+        self.validated_file = self.output_dir / "self_validation_validated.txt"
+        self.rejected_file = self.output_dir / "self_validation_rejected.txt"
+        self.log_file = self.output_dir / "self_validation_log.jsonl"
         
         # Initialize validation sets
         self.proper_nouns = self._load_proper_nouns()
         self.abbreviations = self._load_abbreviations()
         self.foreign_words = self._load_foreign_words()
         
+        # Rejection reason for every listed word, so validation needs one
+        # lookup; a word in several lists keeps the reason checked first
+        self.rejection_reasons: Dict[str, str] = {}
+        for reason, words in [
+            ("proper noun", self.proper_nouns),
+            ("abbreviation", self.abbreviations),
+            ("foreign word", self.foreign_words),
+            ("archaic word", ARCHAIC_WORDS),
+            ("inappropriate/offensive", OFFENSIVE_WORDS),
+        ]:
+            for word in words:
+                self.rejection_reasons.setdefault(word, reason)
+        
     def _load_proper_nouns(self) -> Set[str]:
         """Load comprehensive list of proper nouns to reject."""
         proper_nouns = set()
@@ -284,62 +367,27 @@ class SelfValidatedGenerator:
         if not word_lower.isalpha():
             return False, "contains non-alphabetic characters"
         
-        # Check against proper nouns
-        if word_lower in self.proper_nouns:
-            return False, "proper noun"
-        
-        # Check against abbreviations
-        if word_lower in self.abbreviations:
-            return False, "abbreviation"
-        
-        # Check against foreign words
-        if word_lower in self.foreign_words:
-            return False, "foreign word"
-        
-        # Check for archaic words
-        archaic = {'thou', 'thee', 'thy', 'thine', 'hath', 'hast', 'doth', 'dost', 
-                   'shalt', 'wilt', 'art', 'unto', 'ye', 'yea', 'nay', 'wherefore',
-                   'whence', 'whither', 'thence', 'thither', 'hither', 'betwixt'}
-        if word_lower in archaic:
-            return False, "archaic word"
-        
-        # Check for offensive/inappropriate words
-        offensive = {'damn', 'hell', 'bastard', 'bitch', 'shit', 'fuck', 'ass', 'piss',
-                    'crap', 'dick', 'cock', 'pussy', 'tit', 'whore', 'slut', 'fag',
-                    'nigger', 'kike', 'spic', 'chink', 'gook', 'wop', 'kraut'}
-        if word_lower in offensive:
-            return False, "inappropriate/offensive"
-        
-        # Check for unusual letter patterns
-        # Too many consecutive vowels
-        if re.search(r'[aeiou]{4,}', word_lower):
-            return False, "too many consecutive vowels"
-        
-        # Too many consecutive consonants
-        if re.search(r'[bcdfghjklmnpqrstvwxyz]{5,}', word_lower):
-            return False, "too many consecutive consonants"
-        
-        # Weird starting patterns
-        if re.search(r'^[xz][^aeiou]', word_lower):
-            return False, "unusual starting pattern"
-        
-        # Triple letters (except for a few valid cases)
-        if re.search(r'(.)\1\1', word_lower) and word_lower not in ['committee', 'balloon', 'success']:
-            return False, "triple letter pattern"
-        
-        # All consonants or all vowels
-        if not any(c in 'aeiou' for c in word_lower):
-            return False, "no vowels"
-        if not any(c in 'bcdfghjklmnpqrstvwxyz' for c in word_lower):
-            return False, "no consonants"
-        
-        # Check if it starts with a number when spelled out
-        number_words = {'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 
-                       'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
-                       'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty', 'thirty',
-                       'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety', 'hundred',
-                       'thousand', 'million', 'billion', 'trillion'}
-        # Number words are actually OK - they're common English words
+        return self.validate_word_normalized(word_lower)
+    
+    def validate_word_normalized(self, word_lower: str) -> Tuple[bool, str]:
+        """
+        Validate a word that is already lowercase, stripped, alphabetic and
+        3-12 letters long, as prepare_candidates guarantees.
+        Returns (is_valid, rejection_reason).
+        """
+        # Check against proper nouns, abbreviations, foreign, archaic and
+        # offensive words
+        reason = self.rejection_reasons.get(word_lower)
+        if reason:
+            return False, reason
+        
+        # Check for unusual letter patterns (runs of vowels or consonants,
+        # odd starts, tripled letters, all consonants or all vowels)
+        issue = _letter_pattern_issue(word_lower)
+        if issue:
+            return False, issue
+        
+        # Number words are OK - they're common English words
         
         return True, ""
     
@@ -363,34 +411,22 @@ class SelfValidatedGenerator:
         # Load 100K words
         _, top_100k = load_or_download_words()
         
-        # Filter candidates
-        candidates = []
-        for word in top_100k:
-            word_lower = word.lower().strip()
-            
-            # Skip if in BIP39
-            if word_lower in bip39_words:
-                continue
-            
-            # Basic length check
-            if len(word_lower) < 3 or len(word_lower) > 12:
-                continue
-            
-            # Must be alphabetic
-            if not word_lower.isalpha():
-                continue
-            
-            candidates.append(word_lower)
+        # Words come back stripped and lowercase. Deduplicate them in order,
+        # drop the BIP39 words in one pass over that much smaller set, then
+        # keep alphabetic words of 3-12 letters
+        unique = dict.fromkeys(top_100k)
+        for word in bip39_words:
+            unique.pop(word, None)
         
-        return candidates
+        return [word for word in unique if 3 <= len(word) <= 12 and word.isalpha()]
     
     def process_batch(self, words: List[str], batch_num: int) -> Tuple[List[str], Dict[str, str]]:
-        """Process a batch of words through validation."""
+        """Process a batch of candidates from prepare_candidates through validation."""
         valid_words = []
         rejection_log = {}
         
         for word in words:
-            is_valid, reason = self.validate_word(word)
+            is_valid, reason = self.validate_word_normalized(word)
             if is_valid:
                 valid_words.append(word)
             else:
@@ -412,23 +448,36 @@ class SelfValidatedGenerator:
                 log_entry['rejection_summary'][reason] = 0
             log_entry['rejection_summary'][reason] += 1
         
-        # Append to log file
-        logs = []
-        if self.log_file.exists():
-            with open(self.log_file) as f:
-                logs = json.load(f)
-        logs.append(log_entry)
-        with open(self.log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        # Append to log file, one JSON entry per line, so each batch writes
+        # only its own entry instead of rewriting the whole log
+        with open(self.log_file, 'a') as f:
+            f.write(json.dumps(log_entry) + '\n')
         
         return valid_words, rejection_log
     
-    def save_state(self, state: ValidationState):
-        """Save current state for resumption."""
+    def start_state(self, state: ValidationState):
+        """Save the full starting state that later batches append to."""
+        with open(self.candidates_file, 'w') as f:
+            f.writelines(word + '\n' for word in state.remaining_candidates)
+        with open(self.validated_file, 'w') as f:
+            f.writelines(word + '\n' for word in state.validated_words)
+        with open(self.rejected_file, 'w') as f:
+            f.writelines(word + '\n' for word in state.rejected_words)
+        self._save_progress(state)
+    
+    def save_state(self, state: ValidationState, valid_words: List[str], rejected_words: List[str]):
+        """Save a batch for resumption, appending only that batch's words."""
+        with open(self.validated_file, 'a') as f:
+            f.writelines(word + '\n' for word in valid_words)
+        with open(self.rejected_file, 'a') as f:
+            f.writelines(word + '\n' for word in rejected_words)
+        self._save_progress(state)
+    
+    def _save_progress(self, state: ValidationState):
+        """Save the batch counters and a cursor into the candidates file."""
         state_data = {
-            'validated_words': list(state.validated_words),
-            'rejected_words': list(state.rejected_words),
-            'remaining_candidates': state.remaining_candidates,
+            'total_candidates': state.total_candidates,
+            'cursor': state.total_candidates - len(state.remaining_candidates),
             'batches_processed': state.batches_processed,
             'start_time': state.start_time,
             'timestamp': time.time()
@@ -444,16 +493,25 @@ class SelfValidatedGenerator:
         try:
             with open(self.state_file) as f:
                 data = json.load(f)
+            candidates = read_wordlist(self.candidates_file)
             return ValidationState(
-                validated_words=set(data['validated_words']),
-                rejected_words=set(data['rejected_words']),
-                remaining_candidates=data['remaining_candidates'],
+                validated_words=set(read_wordlist(self.validated_file)),
+                rejected_words=set(read_wordlist(self.rejected_file)),
+                remaining_candidates=candidates[data['cursor']:],
                 batches_processed=data['batches_processed'],
-                start_time=data['start_time']
+                start_time=data['start_time'],
+                total_candidates=data['total_candidates']
             )
-        except:
+        except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError) as e:
+            print(f"Could not load saved state: {e}")
             return None
     
+    def clear_state(self):
+        """Remove all saved state files."""
+        for path in (self.state_file, self.candidates_file, self.validated_file, self.rejected_file):
+            if path.exists():
+                path.unlink()
+    
     def generate_wordlist(self) -> List[str]:
         """Generate the complete validated wordlist."""
         print("\n" + "="*70)
@@ -481,8 +539,10 @@ class SelfValidatedGenerator:
                 rejected_words=set(),
                 remaining_candidates=candidates,
                 batches_processed=0,
-                start_time=time.time()
+                start_time=time.time(),
+                total_candidates=len(candidates)
             )
+            self.start_state(state)
         else:
             print(f"\nResuming from batch {state.batches_processed}")
             print(f"Current validated words: {len(state.validated_words)}")
@@ -517,7 +577,7 @@ class SelfValidatedGenerator:
                     print(f"    - {reason}: {count}")
             
             # Save state
-            self.save_state(state)
+            self.save_state(state, valid_words, list(rejections))
             
             # Stop if we have enough
             if len(state.validated_words) >= self.target_size:
@@ -584,9 +644,8 @@ def main():
         print(f"  First 20: {words[:20]}")
         print(f"  Last 20: {words[-20:]}")
         
-        # Clean up state file
-        if generator.state_file.exists():
-            generator.state_file.unlink()
+        # Clean up state files
+        generator.clear_state()
         
     except KeyboardInterrupt:
         print("\n\nInterrupted! State saved for resumption.")
@@ -0,0 +1,55 @@
+"""Tests for readability evaluation metrics."""
+
+import random
+
+import pytest
+import evaluate_readability
+from evaluate_readability import phonetic_similarity_test
+
+
+def brute_force_similar_pairs(words):
+    """Count similar pairs by comparing every pair of words directly."""
+    similar = 0
+    for i in range(len(words)):
+        for j in range(i + 1, len(words)):
+            word1, word2 = words[i], words[j]
+            if (abs(len(word1) - len(word2)) <= 1 and
+                sum(c1 == c2 for c1, c2 in zip(word1, word2)) >= len(word1) * 0.6):
+                similar += 1
+    return similar
+
+
+def random_words(seed, count):
+    """Random words of mixed lengths over a small alphabet, so many pairs are similar."""
+    rng = random.Random(seed)
+    words = [''.join(rng.choice('abcde') for _ in range(rng.randint(1, 8)))
+             for _ in range(count)]
+    # Short words, equal lengths and exact duplicates
+    return words + ['a', 'b', 'ab', 'ba', 'ab', 'abc', 'abd', 'abcd', 'abcd']
+
+
+class TestPhoneticSimilarity:
+    """Test the bucketed phonetic similarity count against brute force."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, seed):
+        """Test that bucketing counts exactly the pairs a full comparison finds."""
+        words = random_words(seed, 150)
+        total_pairs = len(words) * (len(words) - 1) // 2
+
+        expected = 1.0 - brute_force_similar_pairs(words) / total_pairs
+        assert phonetic_similarity_test(words) == expected
+
+    def test_matches_brute_force_across_chunks(self, monkeypatch):
+        """Test that buckets split over several broadcast blocks count the same."""
+        monkeypatch.setattr(evaluate_readability, "SIMILARITY_CHUNK", 7)
+        words = random_words(42, 150)
+        total_pairs = len(words) * (len(words) - 1) // 2
+
+        expected = 1.0 - brute_force_similar_pairs(words) / total_pairs
+        assert phonetic_similarity_test(words) == expected
+
+    def test_small_lists(self):
+        """Test lists too small to contain a pair."""
+        assert phonetic_similarity_test([]) == 1.0
+        assert phonetic_similarity_test(["cat"]) == 1.0
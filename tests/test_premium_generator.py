@@ -0,0 +1,54 @@
+"""Tests for the premium word filter."""
+
+import random
+
+import pytest
+from premium_generator import PremiumWordFilter
+
+
+class TestCheckWords:
+    """Test that the batched structural checks agree with the per-word ones."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.filter = PremiumWordFilter()
+
+    def per_word(self, words):
+        """Run the per-word structural checks on each word."""
+        return [
+            self.filter._looks_like_english_word(word)
+            and self.filter._is_pronounceable(word)
+            and self.filter._is_memorable(word)
+            for word in words
+        ]
+
+    def test_matches_per_word_checks_on_chosen_words(self):
+        """Test words picked to hit each check."""
+        words = [
+            # Plain real words
+            "cat", "garden", "window", "simple", "happy", "tree", "banana",
+            # Triple letters and repeated letters
+            "aaab", "booo", "zzzap", "committee", "balloon", "bookkeeper",
+            # No vowels, or vowels only
+            "rhythm", "crwth", "psst", "brr", "aeiou", "eau", "queue",
+            # Long consonant and vowel runs
+            "strengths", "catchphra", "twelfths", "schmaltz", "beauty", "queueing",
+            # Silent starts and ends, difficult clusters
+            "knight", "gnome", "psycho", "wrist", "lamb", "hymn", "autumn",
+            # Uncommon letters and low letter variety
+            "jazz", "quiz", "fuzzy", "xylo", "abab", "lolol",
+            # Affixes and single-vowel shapes
+            "unsung", "string", "strap", "blimp", "sprint", "testing", "redo",
+        ]
+        assert self.filter.check_words(words).tolist() == self.per_word(words)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_per_word_checks_on_random_words(self, seed):
+        """Test random words of every allowed length, weighted toward vowels."""
+        rng = random.Random(seed)
+        alphabet = "abcdefghijklmnopqrstuvwxyz" + "aeiou" * 3
+        words = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(3, 10)))
+            for _ in range(2000)
+        ]
+        assert self.filter.check_words(words).tolist() == self.per_word(words)
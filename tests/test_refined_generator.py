@@ -0,0 +1,47 @@
+"""Tests for the refined word filter."""
+
+import random
+
+import pytest
+from refined_generator import RefinedWordFilter
+
+
+class TestPrefilter:
+    """Test that the batched prefilter agrees with the per-word checks."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.filter = RefinedWordFilter()
+
+    def per_word(self, words):
+        """Keep the words that pass the per-word checks."""
+        return [word for word in words if self.filter._passes_checks(word)]
+
+    def test_matches_per_word_checks_on_chosen_words(self):
+        """Test words picked to hit each check."""
+        words = [
+            # Edge lengths
+            "", "a", "ab", "cat", "abcd", "strawberry", "strawberrys", "extraordinary",
+            # Short codes and excluded words
+            "abc", "xyz", "zzz", "aaron", "alabama", "hello",
+            # Repeated starts and doubled pairs
+            "aaab", "bbbb", "aabb", "aabbb", "aabc", "eeel", "llama",
+            # Vowel-less, consonant-less and extreme vowel ratios
+            "rhythm", "crwth", "aeiou", "queue", "strengths", "eerie",
+            # Non a-z letters, which fall through to the per-word checks
+            "café", "naïve", "über", "ñandu", "éé", "straße", "ab-c", "a1bc",
+            # Plain real words
+            "garden", "window", "simple", "happy", "yolk", "gym",
+        ]
+        assert self.filter.prefilter(words) == self.per_word(words)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_per_word_checks_on_random_words(self, seed):
+        """Test random words of lengths 1-12, weighted toward repeats and vowels."""
+        rng = random.Random(seed)
+        alphabet = "abcdefghijklmnopqrstuvwxyz" + "aeiou" * 3 + "aabb" + "é"
+        words = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            for _ in range(3000)
+        ]
+        assert self.filter.prefilter(words) == self.per_word(words)
@@ -0,0 +1,89 @@
+"""Tests for saving and resuming self-validated generation."""
+
+import pytest
+import self_validated_generator
+from self_validated_generator import SelfValidatedGenerator, ValidationState
+
+
+BIP39_WORDS = ["able", "baker", "cable", "dance", "eagle"]
+
+
+def corpus():
+    """Candidate corpus mixing accepted words, rejections and BIP39 words."""
+    words = [f"{first}{middle}{last}"
+             for first in "bdfglmprst" for middle in ["a", "e", "o", "ai"] for last in "dgmnt"]
+    return words + ["john", "thou", "strengths", "aaaa", "xkcd"] + BIP39_WORDS
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in a scratch directory with a local BIP39 list and corpus."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "wordlists").mkdir()
+    (tmp_path / "wordlists" / "bip39_english.txt").write_text("\n".join(BIP39_WORDS))
+    monkeypatch.setattr(self_validated_generator, "load_or_download_words",
+                        lambda: (BIP39_WORDS, corpus()))
+    return tmp_path
+
+
+def make_generator(target_size):
+    generator = SelfValidatedGenerator(batch_size=20)
+    generator.target_size = target_size
+    return generator
+
+
+class TestStatePersistence:
+    """Test the incremental state files."""
+
+    def test_save_load_round_trip(self, workdir):
+        """Test that appended batches and the cursor load back as saved."""
+        generator = make_generator(100)
+        state = ValidationState(
+            validated_words={"able", "baker"},
+            rejected_words=set(),
+            remaining_candidates=["cat", "dog", "john", "fish", "thou"],
+            batches_processed=0,
+            start_time=123.0,
+            total_candidates=5
+        )
+        generator.start_state(state)
+
+        state.remaining_candidates = state.remaining_candidates[3:]
+        state.validated_words.update(["cat", "dog"])
+        state.rejected_words.add("john")
+        state.batches_processed = 1
+        generator.save_state(state, ["cat", "dog"], ["john"])
+
+        assert generator.load_state() == state
+
+    def test_resume_matches_uninterrupted_run(self, workdir, capsys):
+        """Test that stopping partway and resuming gives the same wordlist."""
+        uninterrupted = make_generator(60).generate_wordlist()
+        make_generator(60).clear_state()
+
+        make_generator(30).generate_wordlist()
+        resumed = make_generator(60)
+        state = resumed.load_state()
+        assert state is not None and state.batches_processed > 0
+        assert resumed.generate_wordlist() == uninterrupted
+
+        capsys.readouterr()
+
+    @pytest.mark.parametrize("content", ["{not json", "[]", '{"cursor": 0}'])
+    def test_corrupt_state_is_reported(self, workdir, capsys, content):
+        """Test that an unreadable state file restarts with a message."""
+        generator = make_generator(60)
+        generator.generate_wordlist()
+        generator.state_file.write_text(content)
+
+        assert generator.load_state() is None
+        assert "Could not load saved state" in capsys.readouterr().out
+
+    def test_missing_word_file_is_reported(self, workdir, capsys):
+        """Test that a state file without its word files restarts with a message."""
+        generator = make_generator(60)
+        generator.generate_wordlist()
+        generator.validated_file.unlink()
+
+        assert generator.load_state() is None
+        assert "Could not load saved state" in capsys.readouterr().out
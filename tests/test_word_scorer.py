@@ -57,4 +57,16 @@ class TestWordScorer:
         
         # Test with different thresholds
         assert self.scorer.is_good_word("through", threshold=0.5)
-        assert not self.scorer.is_good_word("through", threshold=0.8)
\ No newline at end of file
+        assert not self.scorer.is_good_word("through", threshold=0.8)
+    
+    def test_score_words_matches_score_word(self):
+        """Test that batch scoring agrees with scoring words one at a time."""
+        words = ["cat", "Happy", "rhythm", "strengths", "queue", "qat",
+                 "lamb", "knight", "bass", "nation", "aeiou", "xzx", "a", ""]
+        
+        scores = self.scorer.score_words(words)
+        
+        assert len(scores) == len(words)
+        for word, score in zip(words, scores):
+            assert score == self.scorer.score_word(word).total_score, word
+        assert len(self.scorer.score_words([])) == 0
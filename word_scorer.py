@@ -11,13 +11,53 @@ UV Dependencies:
 # requires-python = ">=3.11"
 # dependencies = [
 #     "nltk>=3.8.1",
+#     "numpy>=1.26.0",
 # ]
 # ///
 
 from dataclasses import dataclass
-from typing import Set, Optional
+from typing import Set, Optional, Tuple
 import re
 
+import numpy as np
+
+
+def pack_words(words: list[str], min_width: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack words into a zero-padded (N, max_len) code point matrix and lengths.
+    
+    >>> matrix, lens = pack_words(["cat", "at"])
+    >>> matrix.shape, lens.tolist()
+    ((2, 3), [3, 2])
+    """
+    lens = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+    width = max(int(lens.max(initial=0)), min_width)
+    codes = np.array(words, dtype=f'<U{width}')
+    matrix = codes.view(np.uint32).reshape(len(words), width)
+    return matrix, lens
+
+
+def _codes(text: str) -> np.ndarray:
+    """Code points of a string as a uint32 array."""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+# Bit flags per ASCII code point for the character classes used in scoring;
+# non-ASCII code points are clipped to DEL, which has no flags
+_CONSONANT, _VOWEL, _XZ = 1, 2, 4
+_CHAR_CLASSES = np.zeros(128, dtype=np.uint8)
+_CHAR_CLASSES[_codes('bcdfghjklmnpqrstvwxyz')] |= _CONSONANT
+_CHAR_CLASSES[_codes('aeiou')] |= _VOWEL
+_CHAR_CLASSES[_codes('xz')] |= _XZ
+
+
+def _runs(mask: np.ndarray, k: int) -> np.ndarray:
+    """Rows of a boolean matrix containing k consecutive True values."""
+    width = mask.shape[1]
+    window = mask[:, :width - k + 1].copy()
+    for offset in range(1, k):
+        window &= mask[:, offset:width - k + 1 + offset]
+    return window.any(axis=1)
+
 
 @dataclass
 class WordScore:
@@ -50,6 +90,21 @@ class WordScorer:
         r'[aeiou][bcdfghjklmnpqrstvwxyz][aeiou]',  # CVC pattern
     ]
     
+    # Silent letter patterns and the reason reported for each
+    SILENT_PATTERNS = [
+        (r'mb$', 'silent b'),
+        (r'kn', 'silent k'),
+        (r'wr', 'silent w'),
+        (r'ps', 'silent p'),
+        (r'gn', 'silent g'),
+    ]
+    
+    # Compiled once per class rather than looked up in re's cache per call
+    _DIFFICULT_REGEXES = [(re.compile(p), p) for p in DIFFICULT_PATTERNS]
+    _GOOD_REGEXES = [re.compile(p) for p in GOOD_PATTERNS]
+    _SILENT_REGEXES = [(re.compile(p), reason) for p, reason in SILENT_PATTERNS]
+    _DOUBLE_LETTER = re.compile(r'(.)\1')
+    
     # Common confusable endings
     CONFUSABLE_ENDINGS = [
         ('tion', 'sion'),
@@ -88,15 +143,15 @@ class WordScorer:
         phonetic_score = 1.0
         
         # Check difficult patterns
-        for pattern in self.DIFFICULT_PATTERNS:
-            if re.search(pattern, word):
+        for regex, pattern in self._DIFFICULT_REGEXES:
+            if regex.search(word):
                 phonetic_score *= 0.7
                 reasons.append(f"Contains difficult pattern: {pattern}")
         
         # Check good patterns
         good_pattern_count = 0
-        for pattern in self.GOOD_PATTERNS:
-            if re.search(pattern, word):
+        for regex in self._GOOD_REGEXES:
+            if regex.search(word):
                 good_pattern_count += 1
         
         if good_pattern_count > 0:
@@ -106,7 +161,7 @@ class WordScorer:
         pattern_score = 1.0
         
         # Check for double letters
-        if re.search(r'(.)\1', word):
+        if self._DOUBLE_LETTER.search(word):
             pattern_score *= 0.9
             reasons.append("Contains double letters")
         
@@ -118,16 +173,8 @@ class WordScorer:
                 break
         
         # Silent letters penalty
-        silent_patterns = [
-            (r'mb$', 'silent b'),
-            (r'kn', 'silent k'),
-            (r'wr', 'silent w'),
-            (r'ps', 'silent p'),
-            (r'gn', 'silent g'),
-        ]
-        
-        for pattern, reason in silent_patterns:
-            if re.search(pattern, word):
+        for regex, reason in self._SILENT_REGEXES:
+            if regex.search(word):
                 phonetic_score *= 0.8
                 reasons.append(f"Contains {reason}")
         
@@ -148,6 +195,96 @@ class WordScorer:
         self.scored_words[word] = score
         return score
     
+    def score_words(self, words: list[str]) -> np.ndarray:
+        """Score many words at once, returning their total scores.
+        
+        Gives the same totals as `score_word`, but every pattern is evaluated
+        as a mask over a packed character matrix instead of per word. Results
+        are not added to the per-word cache.
+        
+        >>> WordScorer().score_words(["cat", "rhythm"]).round(4).tolist()
+        [0.94, 0.6715]
+        """
+        words = [word.lower().strip() for word in words]
+        if not words:
+            return np.zeros(0)
+        
+        # Pad so every fixed-width window below fits
+        matrix, lens = pack_words(words, 4)
+        rows = np.arange(len(words))[:, None]
+        classes = _CHAR_CLASSES[np.minimum(matrix, 127)]
+        consonant = (classes & _CONSONANT).astype(bool)
+        vowel = (classes & _VOWEL).astype(bool)
+        
+        def tail(grid: np.ndarray, k: int) -> np.ndarray:
+            """Last k columns of each word (meaningful where lens >= k)."""
+            positions = np.maximum(lens[:, None] - k + np.arange(k), 0)
+            return grid[rows, positions]
+        
+        def ends_with(suffix: str) -> np.ndarray:
+            k = len(suffix)
+            return (lens >= k) & (tail(matrix, k) == _codes(suffix)).all(axis=1)
+        
+        def contains(pair: str) -> np.ndarray:
+            first, second = _codes(pair)
+            return ((matrix[:, :-1] == first) & (matrix[:, 1:] == second)).any(axis=1)
+        
+        # Length score (prefer 4-7 letters)
+        length_score = np.select(
+            [(lens >= 4) & (lens <= 7), (lens >= 3) & (lens <= 8), (lens >= 2) & (lens <= 10)],
+            [1.0, 0.8, 0.5],
+            0.2,
+        )
+        
+        # Difficult patterns, in the same order as DIFFICULT_PATTERNS
+        xz = (classes & _XZ).astype(bool)
+        next_is_u = np.zeros_like(vowel)
+        next_is_u[:, :-1] = matrix[:, 1:] == ord('u')
+        difficult = [
+            _runs(xz, 2),
+            _runs(consonant, 4),
+            consonant[:, :3].all(axis=1),
+            (lens >= 3) & tail(consonant, 3).all(axis=1),
+            ((matrix == ord('q')) & ~next_is_u).any(axis=1),
+            _runs(vowel, 4),
+        ]
+        phonetic_score = np.ones(len(words))
+        for mask in difficult:
+            phonetic_score = np.where(mask, phonetic_score * 0.7, phonetic_score)
+        
+        # Good patterns, in the same order as GOOD_PATTERNS
+        vowel_consonant_end = (lens >= 2) & (tail(vowel, 2)[:, 0] & tail(consonant, 2)[:, 1])
+        good_pattern_count = (
+            (consonant[:, 0] & vowel[:, 1]).astype(int) +
+            vowel_consonant_end.astype(int) +
+            (vowel[:, :-2] & consonant[:, 1:-1] & vowel[:, 2:]).any(axis=1).astype(int)
+        )
+        phonetic_score = np.where(
+            good_pattern_count > 0,
+            np.minimum(1.0, phonetic_score * (1.0 + 0.1 * good_pattern_count)),
+            phonetic_score,
+        )
+        
+        # Pattern score: double letters, then at most one confusable ending
+        valid_pair = np.arange(matrix.shape[1] - 1) < (lens[:, None] - 1)
+        double = ((matrix[:, :-1] == matrix[:, 1:]) & valid_pair).any(axis=1)
+        pattern_score = np.where(double, 0.9, 1.0)
+        confusable = np.zeros(len(words), dtype=bool)
+        for end1, end2 in self.CONFUSABLE_ENDINGS:
+            confusable |= ends_with(end1) | ends_with(end2)
+        pattern_score = np.where(confusable, pattern_score * 0.9, pattern_score)
+        
+        # Silent letters, in the same order as SILENT_PATTERNS
+        silent = [ends_with('mb'), contains('kn'), contains('wr'),
+                  contains('ps'), contains('gn')]
+        for mask in silent:
+            phonetic_score = np.where(mask, phonetic_score * 0.8, phonetic_score)
+        
+        # Calculate total score
+        return (length_score * 0.3 +
+                phonetic_score * 0.5 +
+                pattern_score * 0.2)
+    
     def is_good_word(self, word: str, threshold: float = 0.7) -> bool:
         """Check if a word meets the quality threshold."""
         score = self.score_word(word)